@@ -0,0 +1,20 @@
+"""
+Flight Management System - Shared Helpers
+Small utilities used by both create_db.py and flight_cli.py
+
+Kept in one place so the two scripts store times and write listings the
+same way.
+"""
+
+import sys
+
+
+def epoch(dt):
+    """Convert a local datetime to the Unix epoch seconds stored in flights"""
+    return int(dt.timestamp())
+
+def write_lines(lines):
+    """Write formatted rows to stdout with a single write call"""
+    text = "\n".join(lines)
+    if text:
+        sys.stdout.write(text + "\n")
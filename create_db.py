@@ -1,63 +1,235 @@
 import sqlite3
-import random
 from datetime import datetime, timedelta
+from functools import lru_cache
+
+from common import epoch, write_lines
+from db_schema import COUNTERS_SQL, INDEX_SQL
+
+# Schema definition: drop existing tables (for clean setup), then create
+# DESTINATIONS, PILOTS and FLIGHTS, followed by the shared indexes and the
+# trigger-maintained counter tables from db_schema (the same scripts the CLI
+# runs to upgrade older databases, so the two can never drift apart).
+# The reference tables use a plain INTEGER PRIMARY KEY (rowid alias): the rowid
+# B-tree is already keyed on the id, and skipping AUTOINCREMENT avoids the
+# sqlite_sequence bookkeeping on every insert.
+SCHEMA_SQL = '''
+    DROP TABLE IF EXISTS table_counts;
+    DROP TABLE IF EXISTS dest_flight_counts;
+    DROP TABLE IF EXISTS flights;
+    DROP TABLE IF EXISTS pilots;
+    DROP TABLE IF EXISTS destinations;
+    
+    CREATE TABLE destinations (
+        destination_id INTEGER PRIMARY KEY,
+        airport_code VARCHAR(3) UNIQUE NOT NULL,
+        city_name VARCHAR(50) NOT NULL,
+        country VARCHAR(50) NOT NULL,
+        timezone VARCHAR(20) NOT NULL,
+        terminal_info VARCHAR(100)
+    );
+    
+    CREATE TABLE pilots (
+        pilot_id INTEGER PRIMARY KEY,
+        first_name VARCHAR(30) NOT NULL,
+        last_name VARCHAR(30) NOT NULL,
+        license_no VARCHAR(20) UNIQUE NOT NULL,
+        experience_years INTEGER NOT NULL,
+        phone VARCHAR(15)
+    );
+    
+    CREATE TABLE flights (
+        flight_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        flight_number VARCHAR(10) UNIQUE NOT NULL,
+        departure_time INTEGER NOT NULL,  -- Unix epoch seconds
+        arrival_time INTEGER NOT NULL,    -- Unix epoch seconds
+        status VARCHAR(20) DEFAULT 'Scheduled',
+        aircraft_type VARCHAR(30) NOT NULL,
+        capacity INTEGER NOT NULL,
+        pilot_id INTEGER,
+        destination_id INTEGER NOT NULL,
+        FOREIGN KEY (pilot_id) REFERENCES pilots(pilot_id),
+        FOREIGN KEY (destination_id) REFERENCES destinations(destination_id)
+    );
+    
+''' + INDEX_SQL + COUNTERS_SQL
+
+# Demo queries, kept as module-level constants so every execute passes the
+# same SQL text and hits the sqlite3 statement cache instead of re-preparing
+FLIGHTS_BY_CODE_SQL = '''
+    SELECT f.flight_number, datetime(f.departure_time, 'unixepoch', 'localtime') AS departure_time,
+           datetime(f.arrival_time, 'unixepoch', 'localtime') AS arrival_time, f.status, 
+           d.city_name, d.airport_code
+    FROM flights f
+    JOIN destinations d ON f.destination_id = d.destination_id
+    WHERE d.airport_code = ?
+'''
+
+FLIGHTS_BY_STATUS_SQL = '''
+    SELECT f.flight_number, datetime(f.departure_time, 'unixepoch', 'localtime') AS departure_time, f.status, 
+           d.city_name, p.first_name, p.last_name
+    FROM flights f
+    JOIN destinations d ON f.destination_id = d.destination_id
+    JOIN pilots p ON f.pilot_id = p.pilot_id
+    WHERE f.status = ?
+'''
+
+TODAYS_FLIGHTS_SQL = '''
+    SELECT f.flight_number, datetime(f.departure_time, 'unixepoch', 'localtime') AS departure_time,
+           datetime(f.arrival_time, 'unixepoch', 'localtime') AS arrival_time, 
+           d.city_name, f.aircraft_type
+    FROM flights f
+    JOIN destinations d ON f.destination_id = d.destination_id
+    WHERE f.departure_time >= ? AND f.departure_time < ?
+    ORDER BY f.departure_time
+'''
+
+FLIGHT_BY_NUMBER_SQL = '''
+    SELECT flight_number, datetime(departure_time, 'unixepoch', 'localtime') AS departure_time, status 
+    FROM flights 
+    WHERE flight_number = ?
+'''
+
+UPDATE_DEPARTURE_SQL = '''
+    UPDATE flights 
+    SET departure_time = ? 
+    WHERE flight_number = ?
+'''
+
+UPDATE_STATUS_SQL = '''
+    UPDATE flights 
+    SET status = ? 
+    WHERE flight_number = ?
+'''
+
+PILOT_ID_BY_NAME_SQL = '''
+    SELECT pilot_id 
+    FROM pilots 
+    WHERE first_name = ? AND last_name = ?
+'''
+
+ASSIGN_PILOT_SQL = '''
+    UPDATE flights 
+    SET pilot_id = ? 
+    WHERE flight_number = ?
+'''
+
+PILOT_SCHEDULE_BY_NAME_SQL = '''
+    SELECT f.flight_number, datetime(f.departure_time, 'unixepoch', 'localtime') AS departure_time,
+           datetime(f.arrival_time, 'unixepoch', 'localtime') AS arrival_time, 
+           d.city_name, f.status
+    FROM flights f
+    JOIN destinations d ON f.destination_id = d.destination_id
+    JOIN pilots p ON f.pilot_id = p.pilot_id
+    WHERE p.first_name = ? AND p.last_name = ?
+    ORDER BY f.departure_time
+'''
+
+PILOT_WORKLOADS_SQL = '''
+    SELECT p.pilot_id, p.first_name, p.last_name, p.license_no, 
+           p.experience_years, COUNT(f.flight_id) as flights_assigned
+    FROM pilots p
+    LEFT JOIN flights f ON p.pilot_id = f.pilot_id
+    GROUP BY p.pilot_id
+'''
+
+ALL_DESTINATIONS_SQL = '''
+    SELECT airport_code, city_name, country, timezone, terminal_info
+    FROM destinations
+    ORDER BY country, city_name
+'''
+
+UPDATE_TERMINAL_SQL = '''
+    UPDATE destinations 
+    SET terminal_info = ? 
+    WHERE airport_code = ?
+'''
+
+DESTINATION_BY_CODE_SQL = '''
+    SELECT airport_code, city_name, terminal_info 
+    FROM destinations 
+    WHERE airport_code = ?
+'''
+
+FLIGHTS_PER_DESTINATION_SQL = '''
+    SELECT d.city_name, d.airport_code, COUNT(f.flight_id) as flight_count
+    FROM destinations d
+    LEFT JOIN flights f ON d.destination_id = f.destination_id
+    GROUP BY d.destination_id
+    ORDER BY flight_count DESC, d.city_name
+'''
+
+STATUS_SUMMARY_SQL = '''
+    SELECT status, COUNT(*) as count
+    FROM flights
+    GROUP BY status
+    ORDER BY count DESC
+'''
+
+AIRCRAFT_USAGE_SQL = '''
+    SELECT aircraft_type, COUNT(*) as usage_count, 
+           AVG(capacity) as avg_capacity
+    FROM flights
+    GROUP BY aircraft_type
+    ORDER BY usage_count DESC
+'''
+
+UPCOMING_FLIGHTS_SQL = '''
+    SELECT f.flight_number, datetime(f.departure_time, 'unixepoch', 'localtime') AS departure_time, d.city_name, 
+           p.first_name, p.last_name, f.status
+    FROM flights f
+    JOIN destinations d ON f.destination_id = d.destination_id
+    JOIN pilots p ON f.pilot_id = p.pilot_id
+    WHERE f.departure_time BETWEEN ? AND ?
+    ORDER BY f.departure_time
+'''
+
+@lru_cache(maxsize=64)
+def hour_offset(hours):
+    """Return a shared timedelta for an hour offset (offsets repeat across flights)"""
+    return timedelta(hours=hours)
+
+# Bind datetime parameters straight to INTEGER epoch seconds instead of going
+# through sqlite3's default (string-formatting) datetime adapter
+sqlite3.register_adapter(datetime, epoch)
+
+def configure_connection(cursor):
+    """Apply journal and cache PRAGMAs (must run outside a transaction)"""
+    
+    # WAL + NORMAL sync: one fsync per checkpoint instead of two per commit
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    # Negative cache_size is in KiB: 64 MB page cache
+    cursor.execute('PRAGMA cache_size=-64000')
+
+def insert_rows(cursor, table, columns, rows):
+    """Insert all rows with one multi-row INSERT statement (single prepare/step)"""
+    
+    placeholders = "(" + ", ".join(["?"] * len(columns)) + ")"
+    values = ", ".join([placeholders] * len(rows))
+    params = [value for row in rows for value in row]
+    cursor.execute(f'''
+        INSERT INTO {table} ({", ".join(columns)})
+        VALUES {values}
+    ''', params)
 
 def create_database():
     """Create the Flight Management Database with all tables and sample data"""
     
     # Connect to SQLite database (creates if doesn't exist)
-    conn = sqlite3.connect('flight_management.db')
+    # Larger statement cache so every demo query stays prepared
+    conn = sqlite3.connect('flight_management.db', cached_statements=256)
+    # Drive transactions manually so the DDL doesn't commit part-way through
+    conn.isolation_level = None
     cursor = conn.cursor()
-    
-    # Drop existing tables if they exist (for clean setup)
-    cursor.execute('DROP TABLE IF EXISTS flights')
-    cursor.execute('DROP TABLE IF EXISTS pilots')
-    cursor.execute('DROP TABLE IF EXISTS destinations')
+    configure_connection(cursor)
     
     print("Creating Flight Management Database...")
     
-    # CREATE TABLES
-    
-    # 1. Create DESTINATIONS table
-    cursor.execute('''
-        CREATE TABLE destinations (
-            destination_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            airport_code VARCHAR(3) UNIQUE NOT NULL,
-            city_name VARCHAR(50) NOT NULL,
-            country VARCHAR(50) NOT NULL,
-            timezone VARCHAR(20) NOT NULL,
-            terminal_info VARCHAR(100)
-        )
-    ''')
-    
-    # 2. Create PILOTS table
-    cursor.execute('''
-        CREATE TABLE pilots (
-            pilot_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            first_name VARCHAR(30) NOT NULL,
-            last_name VARCHAR(30) NOT NULL,
-            license_no VARCHAR(20) UNIQUE NOT NULL,
-            experience_years INTEGER NOT NULL,
-            phone VARCHAR(15)
-        )
-    ''')
-    
-    # 3. Create FLIGHTS table
-    cursor.execute('''
-        CREATE TABLE flights (
-            flight_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            flight_number VARCHAR(10) UNIQUE NOT NULL,
-            departure_time DATETIME NOT NULL,
-            arrival_time DATETIME NOT NULL,
-            status VARCHAR(20) DEFAULT 'Scheduled',
-            aircraft_type VARCHAR(30) NOT NULL,
-            capacity INTEGER NOT NULL,
-            pilot_id INTEGER,
-            destination_id INTEGER NOT NULL,
-            FOREIGN KEY (pilot_id) REFERENCES pilots(pilot_id),
-            FOREIGN KEY (destination_id) REFERENCES destinations(destination_id)
-        )
-    ''')
+    # Drop and recreate all tables in one script (one parse, no per-statement calls).
+    # executescript() commits any open transaction first, so the BEGIN that keeps
+    # the whole build in a single transaction (one commit/fsync) is part of the script.
+    cursor.executescript('BEGIN IMMEDIATE;' + SCHEMA_SQL)
     
     print("Tables created successfully!")
     
@@ -82,10 +254,9 @@ def create_database():
         ('YYZ', 'Toronto', 'Canada', 'EST-5', 'Terminal 1')
     ]
     
-    cursor.executemany('''
-        INSERT INTO destinations (airport_code, city_name, country, timezone, terminal_info)
-        VALUES (?, ?, ?, ?, ?)
-    ''', destinations_data)
+    insert_rows(cursor, 'destinations',
+                ('airport_code', 'city_name', 'country', 'timezone', 'terminal_info'),
+                destinations_data)
     
     # Insert sample PILOTS (12 records)
     pilots_data = [
@@ -103,40 +274,54 @@ def create_database():
         ('Anna', 'Martin', 'ATP012345', 6, '+44-20-2345-6701')
     ]
     
-    cursor.executemany('''
-        INSERT INTO pilots (first_name, last_name, license_no, experience_years, phone)
-        VALUES (?, ?, ?, ?, ?)
-    ''', pilots_data)
+    insert_rows(cursor, 'pilots',
+                ('first_name', 'last_name', 'license_no', 'experience_years', 'phone'),
+                pilots_data)
     
     # Insert sample FLIGHTS (15 records)
     # Generate realistic flight data
     base_date = datetime.now().replace(hour=8, minute=0, second=0, microsecond=0)
     
+    # (departure, arrival) offsets in hours from base_date
+    hour_offsets = [
+        (2, 4), (6, 14), (10, 12), (14, 22), (18, 30),
+        (26, 38), (30, 32), (34, 42), (38, 50), (42, 54),
+        (50, 52), (54, 56), (58, 60), (62, 74), (66, 78)
+    ]
+    
+    flight_meta = [
+        ('BA101', 'Scheduled', 'Boeing 737', 180, 1, 1),
+        ('BA102', 'Scheduled', 'Airbus A350', 300, 2, 2),
+        ('BA103', 'Delayed', 'Boeing 777', 350, 3, 3),
+        ('BA104', 'Scheduled', 'Airbus A380', 500, 4, 4),
+        ('BA105', 'Scheduled', 'Boeing 787', 250, 5, 5),
+        ('BA106', 'Scheduled', 'Airbus A320', 150, 6, 6),
+        ('BA107', 'Scheduled', 'Boeing 737', 180, 7, 7),
+        ('BA108', 'Cancelled', 'Airbus A330', 280, 8, 8),
+        ('BA109', 'Scheduled', 'Boeing 777', 350, 9, 9),
+        ('BA110', 'Scheduled', 'Airbus A350', 300, 10, 10),
+        ('BA111', 'Scheduled', 'Boeing 737', 180, 11, 11),
+        ('BA112', 'Scheduled', 'Airbus A320', 150, 12, 12),
+        ('BA113', 'Scheduled', 'Boeing 787', 250, 1, 13),
+        ('BA114', 'Scheduled', 'Airbus A380', 500, 2, 14),
+        ('BA115', 'Delayed', 'Boeing 777', 350, 3, 15)
+    ]
+    
     flights_data = [
-        ('BA101', base_date + timedelta(hours=2), base_date + timedelta(hours=4), 'Scheduled', 'Boeing 737', 180, 1, 1),
-        ('BA102', base_date + timedelta(hours=6), base_date + timedelta(hours=14), 'Scheduled', 'Airbus A350', 300, 2, 2),
-        ('BA103', base_date + timedelta(hours=10), base_date + timedelta(hours=12), 'Delayed', 'Boeing 777', 350, 3, 3),
-        ('BA104', base_date + timedelta(hours=14), base_date + timedelta(hours=22), 'Scheduled', 'Airbus A380', 500, 4, 4),
-        ('BA105', base_date + timedelta(hours=18), base_date + timedelta(hours=30), 'Scheduled', 'Boeing 787', 250, 5, 5),
-        ('BA106', base_date + timedelta(days=1, hours=2), base_date + timedelta(days=1, hours=14), 'Scheduled', 'Airbus A320', 150, 6, 6),
-        ('BA107', base_date + timedelta(days=1, hours=6), base_date + timedelta(days=1, hours=8), 'Scheduled', 'Boeing 737', 180, 7, 7),
-        ('BA108', base_date + timedelta(days=1, hours=10), base_date + timedelta(days=1, hours=18), 'Cancelled', 'Airbus A330', 280, 8, 8),
-        ('BA109', base_date + timedelta(days=1, hours=14), base_date + timedelta(days=2, hours=2), 'Scheduled', 'Boeing 777', 350, 9, 9),
-        ('BA110', base_date + timedelta(days=1, hours=18), base_date + timedelta(days=2, hours=6), 'Scheduled', 'Airbus A350', 300, 10, 10),
-        ('BA111', base_date + timedelta(days=2, hours=2), base_date + timedelta(days=2, hours=4), 'Scheduled', 'Boeing 737', 180, 11, 11),
-        ('BA112', base_date + timedelta(days=2, hours=6), base_date + timedelta(days=2, hours=8), 'Scheduled', 'Airbus A320', 150, 12, 12),
-        ('BA113', base_date + timedelta(days=2, hours=10), base_date + timedelta(days=2, hours=12), 'Scheduled', 'Boeing 787', 250, 1, 13),
-        ('BA114', base_date + timedelta(days=2, hours=14), base_date + timedelta(days=3, hours=2), 'Scheduled', 'Airbus A380', 500, 2, 14),
-        ('BA115', base_date + timedelta(days=2, hours=18), base_date + timedelta(days=3, hours=6), 'Delayed', 'Boeing 777', 350, 3, 15)
+        (number, base_date + hour_offset(dep), base_date + hour_offset(arr), status, aircraft, capacity, pilot_id, dest_id)
+        for (dep, arr), (number, status, aircraft, capacity, pilot_id, dest_id) in zip(hour_offsets, flight_meta)
     ]
     
-    cursor.executemany('''
-        INSERT INTO flights (flight_number, departure_time, arrival_time, status, aircraft_type, capacity, pilot_id, destination_id)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    ''', flights_data)
+    insert_rows(cursor, 'flights',
+                ('flight_number', 'departure_time', 'arrival_time', 'status',
+                 'aircraft_type', 'capacity', 'pilot_id', 'destination_id'),
+                flights_data)
+    
+    # Gather planner statistics now that the indexes are populated
+    cursor.execute('ANALYZE')
     
     # Commit changes
-    conn.commit()
+    cursor.execute('COMMIT')
     print(f"Database populated with:")
     print(f"- {len(destinations_data)} destinations")
     print(f"- {len(pilots_data)} pilots")
@@ -144,11 +329,16 @@ def create_database():
     
     return conn
 
-def demonstrate_queries():
-    """Demonstrate all required SQL queries"""
+def demonstrate_queries(conn):
+    """Demonstrate all required SQL queries on the already-open connection"""
     
-    conn = sqlite3.connect('flight_management.db')
-    cursor = conn.cursor()
+    # Access result columns by name rather than tuple position
+    conn.row_factory = sqlite3.Row
+    
+    # Take the clock once; every time-relative query binds these values
+    now = datetime.now()
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    tomorrow = today + timedelta(days=1)
     
     print("\n" + "="*60)
     print("FLIGHT MANAGEMENT SYSTEM - SQL QUERY DEMONSTRATIONS")
@@ -160,80 +350,42 @@ def demonstrate_queries():
     
     # 1a. Retrieve flights by destination
     print("\n1a. Flights to London (LHR):")
-    cursor.execute('''
-        SELECT f.flight_number, f.departure_time, f.arrival_time, f.status, 
-               d.city_name, d.airport_code
-        FROM flights f
-        JOIN destinations d ON f.destination_id = d.destination_id
-        WHERE d.airport_code = 'LHR'
-    ''')
-    for row in cursor.fetchall():
-        print(f"Flight {row[0]}: {row[1]} -> {row[2]} | Status: {row[3]} | To: {row[4]} ({row[5]})")
+    write_lines(f"Flight {row['flight_number']}: {row['departure_time']} -> {row['arrival_time']} | Status: {row['status']} | To: {row['city_name']} ({row['airport_code']})"
+                for row in conn.execute(FLIGHTS_BY_CODE_SQL, ('LHR',)))
     
     # 1b. Retrieve flights by status
     print("\n1b. All Delayed Flights:")
-    cursor.execute('''
-        SELECT f.flight_number, f.departure_time, f.status, 
-               d.city_name, p.first_name, p.last_name
-        FROM flights f
-        JOIN destinations d ON f.destination_id = d.destination_id
-        JOIN pilots p ON f.pilot_id = p.pilot_id
-        WHERE f.status = 'Delayed'
-    ''')
-    for row in cursor.fetchall():
-        print(f"Flight {row[0]}: {row[1]} | Status: {row[2]} | To: {row[3]} | Pilot: {row[4]} {row[5]}")
+    write_lines(f"Flight {row['flight_number']}: {row['departure_time']} | Status: {row['status']} | To: {row['city_name']} | Pilot: {row['first_name']} {row['last_name']}"
+                for row in conn.execute(FLIGHTS_BY_STATUS_SQL, ('Delayed',)))
     
     # 1c. Retrieve flights by departure date
     print("\n1c. Flights departing today:")
-    today = datetime.now().strftime('%Y-%m-%d')
-    cursor.execute('''
-        SELECT f.flight_number, f.departure_time, f.arrival_time, 
-               d.city_name, f.aircraft_type
-        FROM flights f
-        JOIN destinations d ON f.destination_id = d.destination_id
-        WHERE DATE(f.departure_time) = DATE('now')
-        ORDER BY f.departure_time
-    ''')
-    for row in cursor.fetchall():
-        print(f"Flight {row[0]}: {row[1]} -> {row[2]} | To: {row[3]} | Aircraft: {row[4]}")
+    write_lines(f"Flight {row['flight_number']}: {row['departure_time']} -> {row['arrival_time']} | To: {row['city_name']} | Aircraft: {row['aircraft_type']}"
+                for row in conn.execute(TODAYS_FLIGHTS_SQL, (today, tomorrow)))
     
     # 2. SCHEDULE MODIFICATION QUERIES
     print("\n\n2. SCHEDULE MODIFICATION QUERIES")
     print("-" * 32)
     
+    # Updates 2a, 2b and 3a share one transaction (one commit); the verification
+    # SELECTs run inside it and see the pending changes
+    conn.execute('BEGIN')
+    
     # 2a. Update departure time
     print("\n2a. Updating flight BA103 departure time...")
-    new_departure = datetime.now() + timedelta(hours=12)
-    cursor.execute('''
-        UPDATE flights 
-        SET departure_time = ? 
-        WHERE flight_number = 'BA103'
-    ''', (new_departure,))
+    new_departure = now + timedelta(hours=12)
+    conn.execute(UPDATE_DEPARTURE_SQL, (new_departure, 'BA103'))
     
     # Verify the update
-    cursor.execute('''
-        SELECT flight_number, departure_time, status 
-        FROM flights 
-        WHERE flight_number = 'BA103'
-    ''')
-    row = cursor.fetchone()
-    print(f"Updated: Flight {row[0]} - New departure: {row[1]} | Status: {row[2]}")
+    row = conn.execute(FLIGHT_BY_NUMBER_SQL, ('BA103',)).fetchone()
+    print(f"Updated: Flight {row['flight_number']} - New departure: {row['departure_time']} | Status: {row['status']}")
     
     # 2b. Update flight status
     print("\n2b. Updating flight BA108 status from Cancelled to Scheduled...")
-    cursor.execute('''
-        UPDATE flights 
-        SET status = 'Scheduled' 
-        WHERE flight_number = 'BA108'
-    ''')
-    
-    cursor.execute('''
-        SELECT flight_number, status, departure_time 
-        FROM flights 
-        WHERE flight_number = 'BA108'
-    ''')
-    row = cursor.fetchone()
-    print(f"Updated: Flight {row[0]} - Status: {row[1]} | Departure: {row[2]}")
+    conn.execute(UPDATE_STATUS_SQL, ('Scheduled', 'BA108'))
+    
+    row = conn.execute(FLIGHT_BY_NUMBER_SQL, ('BA108',)).fetchone()
+    print(f"Updated: Flight {row['flight_number']} - Status: {row['status']} | Departure: {row['departure_time']}")
     
     # 3. PILOT ASSIGNMENT QUERIES
     print("\n\n3. PILOT ASSIGNMENT QUERIES")
@@ -241,38 +393,22 @@ def demonstrate_queries():
     
     # 3a. Assign pilot to flight
     print("\n3a. Assigning pilot John Smith to flight BA115...")
-    cursor.execute('''
-        UPDATE flights 
-        SET pilot_id = (SELECT pilot_id FROM pilots WHERE first_name = 'John' AND last_name = 'Smith')
-        WHERE flight_number = 'BA115'
-    ''')
+    # Resolve the pilot once, then bind the id (no subquery per updated row)
+    pilot_id = conn.execute(PILOT_ID_BY_NAME_SQL, ('John', 'Smith')).fetchone()['pilot_id']
+    conn.execute(ASSIGN_PILOT_SQL, (pilot_id, 'BA115'))
+    conn.execute('COMMIT')
     
     # 3b. Retrieve pilot schedules
     print("\n3b. John Smith's Flight Schedule:")
-    cursor.execute('''
-        SELECT f.flight_number, f.departure_time, f.arrival_time, 
-               d.city_name, f.status
-        FROM flights f
-        JOIN destinations d ON f.destination_id = d.destination_id
-        JOIN pilots p ON f.pilot_id = p.pilot_id
-        WHERE p.first_name = 'John' AND p.last_name = 'Smith'
-        ORDER BY f.departure_time
-    ''')
-    for row in cursor.fetchall():
-        print(f"Flight {row[0]}: {row[1]} -> {row[2]} | To: {row[3]} | Status: {row[4]}")
+    write_lines(f"Flight {row['flight_number']}: {row['departure_time']} -> {row['arrival_time']} | To: {row['city_name']} | Status: {row['status']}"
+                for row in conn.execute(PILOT_SCHEDULE_BY_NAME_SQL, ('John', 'Smith')))
     
     # 3c. All pilots and their assigned flights count
     print("\n3c. All Pilots and Their Flight Assignments:")
-    cursor.execute('''
-        SELECT p.first_name, p.last_name, p.license_no, 
-               COUNT(f.flight_id) as flights_assigned
-        FROM pilots p
-        LEFT JOIN flights f ON p.pilot_id = f.pilot_id
-        GROUP BY p.pilot_id
-        ORDER BY flights_assigned DESC
-    ''')
-    for row in cursor.fetchall():
-        print(f"Pilot: {row[0]} {row[1]} | License: {row[2]} | Flights Assigned: {row[3]}")
+    # One aggregation pass serves both 3c and 5b (nothing in between touches pilot assignments)
+    pilot_workloads = conn.execute(PILOT_WORKLOADS_SQL).fetchall()
+    write_lines(f"Pilot: {row['first_name']} {row['last_name']} | License: {row['license_no']} | Flights Assigned: {row['flights_assigned']}"
+                for row in sorted(pilot_workloads, key=lambda r: -r['flights_assigned']))
     
     # 4. DESTINATION MANAGEMENT QUERIES
     print("\n\n4. DESTINATION MANAGEMENT QUERIES")
@@ -280,29 +416,15 @@ def demonstrate_queries():
     
     # 4a. View all destinations
     print("\n4a. All Destinations:")
-    cursor.execute('''
-        SELECT airport_code, city_name, country, timezone, terminal_info
-        FROM destinations
-        ORDER BY country, city_name
-    ''')
-    for row in cursor.fetchall():
-        print(f"{row[0]} - {row[1]}, {row[2]} | Timezone: {row[3]} | Terminal: {row[4]}")
+    write_lines(f"{row['airport_code']} - {row['city_name']}, {row['country']} | Timezone: {row['timezone']} | Terminal: {row['terminal_info']}"
+                for row in conn.execute(ALL_DESTINATIONS_SQL))
     
     # 4b. Update destination information
     print("\n4b. Updating terminal info for Dubai (DXB)...")
-    cursor.execute('''
-        UPDATE destinations 
-        SET terminal_info = 'Terminal 3 - Concourse A' 
-        WHERE airport_code = 'DXB'
-    ''')
-    
-    cursor.execute('''
-        SELECT airport_code, city_name, terminal_info 
-        FROM destinations 
-        WHERE airport_code = 'DXB'
-    ''')
-    row = cursor.fetchone()
-    print(f"Updated: {row[0]} - {row[1]} | New Terminal Info: {row[2]}")
+    conn.execute(UPDATE_TERMINAL_SQL, ('Terminal 3 - Concourse A', 'DXB'))
+    
+    row = conn.execute(DESTINATION_BY_CODE_SQL, ('DXB',)).fetchone()
+    print(f"Updated: {row['airport_code']} - {row['city_name']} | New Terminal Info: {row['terminal_info']}")
     
     # 5. SUMMARY QUERIES
     print("\n\n5. SUMMARY QUERIES")
@@ -310,69 +432,32 @@ def demonstrate_queries():
     
     # 5a. Number of flights to each destination
     print("\n5a. Flights Count by Destination:")
-    cursor.execute('''
-        SELECT d.city_name, d.airport_code, COUNT(f.flight_id) as flight_count
-        FROM destinations d
-        LEFT JOIN flights f ON d.destination_id = f.destination_id
-        GROUP BY d.destination_id
-        ORDER BY flight_count DESC, d.city_name
-    ''')
-    for row in cursor.fetchall():
-        print(f"{row[0]} ({row[1]}): {row[2]} flights")
+    write_lines(f"{row['city_name']} ({row['airport_code']}): {row['flight_count']} flights"
+                for row in conn.execute(FLIGHTS_PER_DESTINATION_SQL))
     
     # 5b. Number of flights assigned to each pilot
     print("\n5b. Flights Assigned per Pilot:")
-    cursor.execute('''
-        SELECT p.first_name, p.last_name, COUNT(f.flight_id) as flights_assigned,
-               p.experience_years
-        FROM pilots p
-        LEFT JOIN flights f ON p.pilot_id = f.pilot_id
-        GROUP BY p.pilot_id
-        ORDER BY flights_assigned DESC, p.experience_years DESC
-    ''')
-    for row in cursor.fetchall():
-        print(f"{row[0]} {row[1]}: {row[2]} flights | Experience: {row[3]} years")
+    write_lines(f"{row['first_name']} {row['last_name']}: {row['flights_assigned']} flights | Experience: {row['experience_years']} years"
+                for row in sorted(pilot_workloads, key=lambda r: (-r['flights_assigned'], -r['experience_years'])))
     
     # 5c. Flight status summary
     print("\n5c. Flight Status Summary:")
-    cursor.execute('''
-        SELECT status, COUNT(*) as count
-        FROM flights
-        GROUP BY status
-        ORDER BY count DESC
-    ''')
-    for row in cursor.fetchall():
-        print(f"{row[0]}: {row[1]} flights")
+    write_lines(f"{row['status']}: {row['count']} flights"
+                for row in conn.execute(STATUS_SUMMARY_SQL))
     
     # 5d. Aircraft type usage
     print("\n5d. Aircraft Type Usage:")
-    cursor.execute('''
-        SELECT aircraft_type, COUNT(*) as usage_count, 
-               AVG(capacity) as avg_capacity
-        FROM flights
-        GROUP BY aircraft_type
-        ORDER BY usage_count DESC
-    ''')
-    for row in cursor.fetchall():
-        print(f"{row[0]}: {row[1]} flights | Avg Capacity: {row[2]:.0f}")
+    write_lines(f"{row['aircraft_type']}: {row['usage_count']} flights | Avg Capacity: {row['avg_capacity']:.0f}"
+                for row in conn.execute(AIRCRAFT_USAGE_SQL))
     
     # 5e. Upcoming flights (next 24 hours)
     print("\n5e. Upcoming Flights (Next 24 Hours):")
-    cursor.execute('''
-        SELECT f.flight_number, f.departure_time, d.city_name, 
-               p.first_name, p.last_name, f.status
-        FROM flights f
-        JOIN destinations d ON f.destination_id = d.destination_id
-        JOIN pilots p ON f.pilot_id = p.pilot_id
-        WHERE f.departure_time BETWEEN datetime('now') AND datetime('now', '+1 day')
-        ORDER BY f.departure_time
-    ''')
-    for row in cursor.fetchall():
-        print(f"Flight {row[0]}: {row[1]} | To: {row[2]} | Pilot: {row[3]} {row[4]} | Status: {row[5]}")
-    
-    # Commit any changes and close
+    write_lines(f"Flight {row['flight_number']}: {row['departure_time']} | To: {row['city_name']} | Pilot: {row['first_name']} {row['last_name']} | Status: {row['status']}"
+                for row in conn.execute(UPCOMING_FLIGHTS_SQL, (now, now + timedelta(days=1))))
+    
+    # Commit any changes and refresh planner statistics
     conn.commit()
-    conn.close()
+    conn.execute('PRAGMA optimize')
     
     print("\n" + "="*60)
     print("All queries executed successfully!")
@@ -382,10 +467,10 @@ def demonstrate_queries():
 if __name__ == "__main__":
     # Create and populate the database
     conn = create_database()
-    conn.close()
     
-    # Demonstrate all the required SQL queries
-    demonstrate_queries()
+    # Demonstrate all the required SQL queries on the same connection
+    demonstrate_queries(conn)
+    conn.close()
     
     print("\n\nDatabase Setup Complete!")
     print("You can now use this database with your Python CLI application.")
@@ -0,0 +1,106 @@
+"""
+Flight Management System - Shared Schema Objects
+Index and counter definitions used by both create_db.py and flight_cli.py
+
+create_db.py runs these scripts when it builds a fresh database; the CLI runs
+the very same text to upgrade an older database on open. Every statement uses
+IF NOT EXISTS / OR IGNORE, so running a script again changes nothing.
+"""
+
+# Indexes on the columns used in WHERE/JOIN/ORDER BY clauses and pilot name
+# lookups (airport_code and flight_number are already indexed by their UNIQUE
+# constraints). The flights indexes filter/join on the leading column and
+# order by departure_time, so SQLite walks the index in order instead of sorting.
+#   idx_flights_status_dep - status search and the status breakdown
+#   idx_flights_dest_dep   - airport search (also serves plain destination_id lookups)
+#   idx_flights_pilot_dep  - pilot schedule (also serves plain pilot_id lookups)
+INDEX_SQL = '''
+    CREATE INDEX IF NOT EXISTS idx_flights_dest_dep ON flights(destination_id, departure_time);
+    CREATE INDEX IF NOT EXISTS idx_flights_pilot_dep ON flights(pilot_id, departure_time);
+    CREATE INDEX IF NOT EXISTS idx_flights_status_dep ON flights(status, departure_time);
+    CREATE INDEX IF NOT EXISTS idx_flights_dep ON flights(departure_time);
+    CREATE INDEX IF NOT EXISTS idx_pilots_name ON pilots(first_name, last_name);
+    CREATE INDEX IF NOT EXISTS idx_dest_country_city ON destinations(country, city_name);
+'''
+
+# Trigger-maintained counters, so the statistics need no scan of FLIGHTS.
+# DEST_FLIGHT_COUNTS is a per-destination flight counter kept current by
+# triggers on FLIGHTS; the triggers on DESTINATIONS give every destination a
+# row, so the top-N ranking is read in order from the index on the count.
+# TABLE_COUNTS holds the row count of each main table, likewise kept by
+# triggers, so the statistics summary reads three rows instead of counting.
+# The closing backfill seeds both from the current data (zero rows on an empty
+# database) and never overwrites a counter that already exists.
+COUNTERS_SQL = '''
+    CREATE TABLE IF NOT EXISTS dest_flight_counts (
+        destination_id INTEGER PRIMARY KEY REFERENCES destinations(destination_id),
+        cnt INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE INDEX IF NOT EXISTS idx_dest_counts_cnt ON dest_flight_counts(cnt DESC);
+    
+    CREATE TRIGGER IF NOT EXISTS trg_flights_count_ins AFTER INSERT ON flights BEGIN
+        INSERT INTO dest_flight_counts (destination_id, cnt) VALUES (NEW.destination_id, 1)
+        ON CONFLICT(destination_id) DO UPDATE SET cnt = cnt + 1;
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_flights_count_del AFTER DELETE ON flights BEGIN
+        UPDATE dest_flight_counts SET cnt = cnt - 1 WHERE destination_id = OLD.destination_id;
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_flights_count_upd AFTER UPDATE OF destination_id ON flights
+    WHEN OLD.destination_id IS NOT NEW.destination_id BEGIN
+        UPDATE dest_flight_counts SET cnt = cnt - 1 WHERE destination_id = OLD.destination_id;
+        INSERT INTO dest_flight_counts (destination_id, cnt) VALUES (NEW.destination_id, 1)
+        ON CONFLICT(destination_id) DO UPDATE SET cnt = cnt + 1;
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_destinations_count_ins AFTER INSERT ON destinations BEGIN
+        INSERT INTO dest_flight_counts (destination_id, cnt) VALUES (NEW.destination_id, 0)
+        ON CONFLICT(destination_id) DO NOTHING;
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_destinations_count_del AFTER DELETE ON destinations BEGIN
+        DELETE FROM dest_flight_counts WHERE destination_id = OLD.destination_id;
+    END;
+    
+    CREATE TABLE IF NOT EXISTS table_counts (
+        name TEXT PRIMARY KEY,
+        n INTEGER NOT NULL DEFAULT 0
+    ) WITHOUT ROWID;
+    
+    CREATE TRIGGER IF NOT EXISTS trg_pilots_total_ins AFTER INSERT ON pilots BEGIN
+        UPDATE table_counts SET n = n + 1 WHERE name = 'pilots';
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_pilots_total_del AFTER DELETE ON pilots BEGIN
+        UPDATE table_counts SET n = n - 1 WHERE name = 'pilots';
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_destinations_total_ins AFTER INSERT ON destinations BEGIN
+        UPDATE table_counts SET n = n + 1 WHERE name = 'destinations';
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_destinations_total_del AFTER DELETE ON destinations BEGIN
+        UPDATE table_counts SET n = n - 1 WHERE name = 'destinations';
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_flights_total_ins AFTER INSERT ON flights BEGIN
+        UPDATE table_counts SET n = n + 1 WHERE name = 'flights';
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_flights_total_del AFTER DELETE ON flights BEGIN
+        UPDATE table_counts SET n = n - 1 WHERE name = 'flights';
+    END;
+    
+    INSERT OR IGNORE INTO dest_flight_counts (destination_id, cnt)
+        SELECT destination_id, COUNT(*) FROM flights GROUP BY destination_id;
+    INSERT OR IGNORE INTO dest_flight_counts (destination_id, cnt)
+        SELECT destination_id, 0 FROM destinations;
+    INSERT OR IGNORE INTO table_counts (name, n)
+        SELECT 'pilots', COUNT(*) FROM pilots
+        UNION ALL SELECT 'destinations', COUNT(*) FROM destinations
+        UNION ALL SELECT 'flights', COUNT(*) FROM flights;
+'''
+
+# Every schema object COUNTERS_SQL creates; a database missing any of them
+# has not had the current script applied yet
+COUNTER_OBJECTS = (
+    'dest_flight_counts', 'idx_dest_counts_cnt',
+    'trg_flights_count_ins', 'trg_flights_count_del', 'trg_flights_count_upd',
+    'trg_destinations_count_ins', 'trg_destinations_count_del',
+    'table_counts',
+    'trg_pilots_total_ins', 'trg_pilots_total_del',
+    'trg_destinations_total_ins', 'trg_destinations_total_del',
+    'trg_flights_total_ins', 'trg_flights_total_del',
+)
@@ -14,8 +14,386 @@ Course: [Course Code]
 Assignment: Flight Management Database System
 """
 
+import atexit
+import contextlib
+import csv
+import json
+import os
 import sqlite3
+import sys
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
+
+from common import epoch, write_lines
+from db_schema import COUNTER_OBJECTS, COUNTERS_SQL, INDEX_SQL
+
+# Importing readline gives interactive input() line editing and history;
+# it is missing on some platforms (e.g. Windows), where input() works as is
+try:
+    import readline  # noqa: F401
+except ImportError:
+    readline = None
+
+# prompt_toolkit is optional: when installed, the interactive menu prompt gets
+# completion of the option numbers; without it the plain prompt is used
+try:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.completion import WordCompleter
+except ImportError:
+    PromptSession = None
+
+# Supported datetime formats for the strptime fallback, keyed by the number of
+# ':' in the input so each string is parsed with exactly one format. (Keyed on
+# colons rather than length: the fallback mostly sees unpadded input such as
+# 2024-1-5 9:30, whose length varies.)
+_FORMATS_BY_COLONS = {
+    0: '%Y-%m-%d',             # 2024-12-25 (assumes midnight)
+    1: '%Y-%m-%d %H:%M',       # 2024-12-25 14:30
+    2: '%Y-%m-%d %H:%M:%S',    # 2024-12-25 14:30:00
+}
+
+# Input type -> converter used by get_user_input (unknown types are kept as text)
+_COERCERS = {int: int, float: float, str: str}
+
+# Valid flight statuses; a frozenset gives hashed membership checks in get_user_input
+_STATUS_OPTIONS = frozenset({'Scheduled', 'Delayed', 'Cancelled'})
+
+@lru_cache(maxsize=512)
+def _parse_dt(date_string):
+    """
+    Parse a user datetime string into (ISO string, datetime) (memoized)
+    
+    Schedules tend to repeat the same few date strings, so repeats are answered
+    from the cache; invalid input raises and is never cached
+    
+    Raises:
+        ValueError: If datetime format is invalid
+    """
+    # Fast path: the C-implemented ISO parser accepts every supported shape.
+    # Timezone-aware input is left to strptime (and rejected) so every
+    # stored value is naive local time
+    try:
+        dt = datetime.fromisoformat(date_string)
+        if dt.tzinfo is None:
+            return dt.isoformat(), dt
+    except ValueError:
+        pass
+    
+    # Fall back to a single strptime with the format matching the input's shape
+    fmt = _FORMATS_BY_COLONS.get(date_string.count(':'))
+    if fmt is not None:
+        try:
+            dt = datetime.strptime(date_string, fmt)
+            return dt.isoformat(), dt
+        except ValueError:
+            pass
+    
+    # If no format matches, raise descriptive error
+    raise ValueError("Invalid date format. Use YYYY-MM-DD HH:MM or YYYY-MM-DD")
+
+def _split_menu_line(line, menu_keys, interactive):
+    """
+    Split a main-menu input line into the choices it holds
+    
+    Args:
+        line (str): The line read at the menu prompt
+        menu_keys (frozenset): The valid menu keys, as strings
+        interactive (bool): Whether the line was typed at a terminal
+        
+    Returns:
+        list: The choices in order, or None when an interactive line mixes
+        menu keys with other text
+        
+    Only a person at a terminal may type several choices on one line. Piped
+    or scripted input stays one choice per line, so a script that has drifted
+    out of step with the prompts ("1 0", or a date answered at the menu) is
+    rejected as one invalid choice instead of running extra commands.
+    Checked with: python -m doctest flight_cli.py
+    
+    >>> keys = frozenset('0123456789')
+    >>> _split_menu_line('1 0', keys, interactive=False)
+    ['1 0']
+    >>> _split_menu_line('2026-11-01 10:00', keys, interactive=False)
+    ['2026-11-01 10:00']
+    >>> _split_menu_line('2026-11-01 10:00', keys, interactive=True) is None
+    True
+    >>> _split_menu_line(' 7 ', keys, interactive=False)
+    ['7']
+    >>> _split_menu_line('1 7', keys, interactive=True)
+    ['1', '7']
+    """
+    if not interactive:
+        return [line.strip()]
+    tokens = line.split()
+    if len(tokens) > 1 and not menu_keys.issuperset(tokens):
+        return None
+    return tokens
+
+# Connection tuning: WAL + synchronous=NORMAL avoids an fsync of the rollback
+# journal on every interactive commit; the rest keeps temp data and pages in RAM
+# (cache_size is a 64 MiB ceiling, allocated only as pages are actually read).
+# busy_timeout makes a second session wait for a lock instead of failing at once.
+_PRAGMA_SQL = '''
+    PRAGMA foreign_keys = ON;
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -65536;
+    PRAGMA busy_timeout = 5000;
+    PRAGMA mmap_size = 268435456;
+'''
+
+# Databases built before times were stored as epoch seconds hold departure and
+# arrival as local-time text ('YYYY-MM-DD HH:MM:SS' or ISO 'T' form). INTEGER
+# sorts before TEXT, so the last entry of idx_flights_dep is text exactly when
+# any unconverted row remains: an O(1) check on every open. The conversion
+# reads the text as local time ('utc' modifier), matching epoch().
+_LAST_DEPARTURE_TYPE_SQL = "SELECT typeof(departure_time) FROM flights ORDER BY departure_time DESC LIMIT 1"
+_EPOCH_MIGRATION_SQL = '''
+    BEGIN IMMEDIATE;
+    UPDATE flights
+    SET departure_time = CASE WHEN typeof(departure_time) = 'text'
+                              THEN CAST(strftime('%s', departure_time, 'utc') AS INTEGER)
+                              ELSE departure_time END,
+        arrival_time = CASE WHEN typeof(arrival_time) = 'text'
+                            THEN CAST(strftime('%s', arrival_time, 'utc') AS INTEGER)
+                            ELSE arrival_time END
+    WHERE typeof(departure_time) = 'text' OR typeof(arrival_time) = 'text';
+    COMMIT;
+'''
+
+# How many of db_schema's counter objects this database already has
+_COUNTER_OBJECTS_SQL = (
+    "SELECT COUNT(*) FROM sqlite_master WHERE name IN (%s)"
+    % ", ".join(f"'{name}'" for name in COUNTER_OBJECTS)
+)
+
+# Main menu, pre-joined so each redraw is a single print
+_MENU_TEXT = (
+    "\n📋 MAIN MENU:\n"
+    "1. 🆕 Add a New Flight\n"               # CRUD: Create operation
+    "2. 🔍 View Flights by Criteria\n"      # CRUD: Read operations with filtering
+    "3. ✏️  Update Flight Information\n"     # CRUD: Update operations
+    "4. 👨‍✈️ Assign Pilot to Flight\n"        # Relationship management
+    "5. 📅 View Pilot Schedule\n"           # Data retrieval and analysis
+    "6. 🌍 View/Update Destination Information\n"  # Destination management
+    "7. 📊 View System Statistics\n"        # Analytics and reporting
+    "8. 📥 Bulk Add Flights from CSV\n"     # Batch CREATE operation
+    "0. 🚪 Exit\n"                         # Application termination
+    + "-" * 60
+)
+# ... and encoded once, for writing straight to a UTF-8 stdout's byte buffer
+_MENU_BYTES = (_MENU_TEXT + "\n").encode('utf-8')
+
+# Refresh planner statistics for flights after this many inserts in a session
+_ANALYZE_EVERY = 50
+
+# Statements issued by the menu handlers, kept as module-level constants so
+# every execute passes the same SQL text and hits the sqlite3 statement cache.
+# INSERT_FLIGHT_SQL relies on the UNIQUE constraint on flights.flight_number:
+# a duplicate number inserts nothing and RETURNING yields no row (SQLite 3.35+).
+LIST_DESTINATIONS_SQL = "SELECT destination_id, airport_code, city_name, terminal_info FROM destinations ORDER BY destination_id"
+LIST_PILOTS_SQL = "SELECT pilot_id, first_name, last_name FROM pilots ORDER BY pilot_id"
+INSERT_FLIGHT_SQL = '''
+    INSERT INTO flights (flight_number, departure_time, arrival_time, status,
+                         aircraft_type, capacity, pilot_id, destination_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(flight_number) DO NOTHING
+    RETURNING flight_id
+'''
+# Bulk variant for executemany: duplicates are skipped and counted via rowcount
+BULK_INSERT_FLIGHT_SQL = '''
+    INSERT INTO flights (flight_number, departure_time, arrival_time, status,
+                         aircraft_type, capacity, pilot_id, destination_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(flight_number) DO NOTHING
+'''
+LIST_FLIGHTS_SQL = '''
+    SELECT f.flight_id, f.flight_number, datetime(f.departure_time, 'unixepoch', 'localtime') AS departure_time, f.status
+    FROM flights f
+    ORDER BY f.departure_time
+'''
+UPDATE_STATUS_SQL = "UPDATE flights SET status = ? WHERE flight_id = ?"
+UPDATE_DEPARTURE_SQL = "UPDATE flights SET departure_time = ? WHERE flight_id = ?"
+UPDATE_AIRCRAFT_SQL = "UPDATE flights SET aircraft_type = ? WHERE flight_id = ?"
+LIST_FLIGHT_PILOTS_SQL = '''
+    SELECT f.flight_id, f.flight_number, datetime(f.departure_time, 'unixepoch', 'localtime') AS departure_time,
+           COALESCE(p.first_name || ' ' || p.last_name, 'Unassigned') AS pilot_name
+    FROM flights f
+    LEFT JOIN pilots p ON f.pilot_id = p.pilot_id
+    ORDER BY f.departure_time
+'''
+ASSIGN_PILOT_SQL = "UPDATE flights SET pilot_id = ? WHERE flight_id = ?"
+UPDATE_TERMINAL_SQL = "UPDATE destinations SET terminal_info = ? WHERE destination_id = ?"
+# The three flight searches share one column list; SQLite builds the display
+# pilot name (COALESCE turns a missing pilot into 'Unassigned'), so rows come
+# back ready to format
+_FLIGHT_SEARCH_SELECT = '''
+    SELECT f.flight_number, datetime(f.departure_time, 'unixepoch', 'localtime') AS departure_time, f.status, d.city_name,
+           COALESCE(p.first_name || ' ' || p.last_name, 'Unassigned') AS pilot_name
+    FROM flights f
+    JOIN destinations d ON f.destination_id = d.destination_id
+    LEFT JOIN pilots p ON f.pilot_id = p.pilot_id
+'''
+FLIGHTS_BY_AIRPORT_SQL = _FLIGHT_SEARCH_SELECT + '''
+    WHERE d.airport_code = ?
+    ORDER BY f.departure_time
+'''
+FLIGHTS_BY_STATUS_SQL = _FLIGHT_SEARCH_SELECT + '''
+    WHERE f.status = ?
+    ORDER BY f.departure_time
+'''
+ALL_FLIGHTS_SQL = _FLIGHT_SEARCH_SELECT + '''
+    ORDER BY f.departure_time
+'''
+PILOT_SCHEDULE_SQL = '''
+    SELECT f.flight_number, datetime(f.departure_time, 'unixepoch', 'localtime') AS departure_time,
+           datetime(f.arrival_time, 'unixepoch', 'localtime') AS arrival_time, f.status, d.city_name
+    FROM flights f
+    JOIN destinations d ON f.destination_id = d.destination_id
+    WHERE f.pilot_id = ?
+    ORDER BY f.departure_time
+'''
+# Per-destination flight counts come from the trigger-maintained
+# dest_flight_counts (one primary-key lookup per destination) rather than a
+# LEFT JOIN over flights with a GROUP BY; destinations with no counter row show 0
+DESTINATION_SUMMARY_SQL = '''
+    SELECT d.destination_id, d.airport_code, d.city_name, d.country,
+           d.terminal_info, COALESCE(c.cnt, 0) as flight_count
+    FROM destinations d
+    LEFT JOIN dest_flight_counts c ON d.destination_id = c.destination_id
+    ORDER BY d.city_name
+'''
+# Walks idx_dest_counts_cnt from the top and stops after five rows (no sort)
+TOP_DESTINATIONS_SQL = '''
+    SELECT d.city_name, d.airport_code, c.cnt as flight_count
+    FROM dest_flight_counts c
+    JOIN destinations d ON d.destination_id = c.destination_id
+    ORDER BY c.cnt DESC
+    LIMIT 5
+'''
+# The whole statistics panel as one statement returning one JSON document:
+# the totals are primary-key lookups in the trigger-maintained table_counts,
+# the status breakdown groups over idx_flights_status_dep (an index-only pass
+# that reports every status present, NULL as '(none)'), and the ranking is TOP_DESTINATIONS_SQL folded into an
+# array. json() keeps the nested array as JSON rather than quoted text. SQLite
+# does not define the order in which an aggregate sees its rows, so the
+# ranking is re-sorted in Python after decoding (see _fetch_statistics)
+STATISTICS_SQL = '''
+    SELECT json_object(
+        'pilots', (SELECT n FROM table_counts WHERE name = 'pilots'),
+        'destinations', (SELECT n FROM table_counts WHERE name = 'destinations'),
+        'flights', (SELECT n FROM table_counts WHERE name = 'flights'),
+        'status', json((
+            SELECT json_group_object(COALESCE(status, '(none)'), n)
+            FROM (SELECT status, COUNT(*) AS n FROM flights GROUP BY status)
+        )),
+        'top_destinations', json((
+            SELECT json_group_array(json_object('city', city_name, 'code', airport_code,
+                                                'flights', flight_count))
+            FROM (''' + TOP_DESTINATIONS_SQL + ''')
+        ))
+    )
+'''
+
+# Listing row templates, bound to str.format once so the listing loops only
+# substitute values instead of re-evaluating an f-string per row. Fields are
+# named after the query's column names and filled from sqlite3.Row via **row,
+# so reordering a SELECT list cannot shift values into the wrong slot
+# (positional {0} is the running row number where a listing has one)
+_FLIGHT_ROW_FMT = "{0:2d}. {flight_number} | {departure_time} | {status} | To: {city_name} | Pilot: {pilot_name}".format
+_FLIGHT_CHOICE_FMT = "  {flight_id}. {flight_number} | {departure_time} | {status}".format
+_FLIGHT_PILOT_FMT = "  {flight_id}. {flight_number} | {departure_time} | Pilot: {pilot_name}".format
+_SCHEDULE_ROW_FMT = "{0}. {flight_number} | {departure_time} → {arrival_time} | {status} | To: {city_name}".format
+_PILOT_ROW_FMT = "  {pilot_id}. {first_name} {last_name}".format
+
+# Statistics summary block, filled with %-formatting and written in one call
+_STATS_TMPL = (
+    "📊 Database Summary:\n"
+    "   👨‍✈️ Total Pilots: %d\n"
+    "   🌍 Total Destinations: %d\n"
+    "   ✈️ Total Flights: %d\n"
+)
+
+# Open connections shared by every CLI instance in this process, keyed by
+# database path, so repeated sessions skip the open/PRAGMA/schema-check setup
+_CONNECTIONS = {}
+
+def _open_connection(db_path, exclusive=False):
+    """
+    Get the session connection for a database, opening and preparing it once
+    
+    Args:
+        db_path (str): Path to SQLite database file
+        exclusive (bool): Hold the database lock until the process exits (sole-writer
+            mode); only honoured when the connection is first opened
+        
+    Returns:
+        sqlite3.Connection: The shared, fully configured connection
+        
+    Raises:
+        sqlite3.Error: If the database cannot be opened or prepared
+    """
+    conn = _CONNECTIONS.get(db_path)
+    if conn is not None:
+        return conn
+    
+    # Create connection to SQLite database file in autocommit mode
+    # (isolation_level=None); multi-statement writes open BEGIN IMMEDIATE
+    # explicitly. The statement cache is sized above the *_SQL constants.
+    conn = sqlite3.connect(db_path, isolation_level=None, cached_statements=256)
+    try:
+        if exclusive:
+            # Sole-writer mode: take the write lock once and keep it, so later
+            # statements skip the per-statement lock/unlock calls and a competing
+            # process is reported now (after busy_timeout) instead of mid-session.
+            # Set before the WAL pragma so the WAL index lives in heap memory
+            # rather than the shared -shm file
+            conn.executescript('PRAGMA busy_timeout = 5000; PRAGMA locking_mode = EXCLUSIVE;'
+                               'BEGIN EXCLUSIVE; COMMIT;')
+        # Rows support both index and column-name access
+        conn.row_factory = sqlite3.Row
+        # Enable foreign key constraints for data integrity, plus WAL/cache tuning
+        conn.executescript(_PRAGMA_SQL)
+        # Make sure the hot-path indexes exist (older databases may lack them)
+        conn.executescript(INDEX_SQL)
+        # Convert text departure/arrival times left by older databases to epoch seconds
+        last = conn.execute(_LAST_DEPARTURE_TYPE_SQL).fetchone()
+        if last is not None and last[0] == 'text':
+            try:
+                conn.executescript(_EPOCH_MIGRATION_SQL)
+            except sqlite3.IntegrityError:
+                # A time SQLite cannot parse became NULL and hit NOT NULL;
+                # nothing was changed, so refuse to run on mixed data
+                if conn.in_transaction:
+                    conn.execute('ROLLBACK')
+                raise sqlite3.DatabaseError(
+                    "flights holds departure/arrival times that cannot be converted to "
+                    "epoch seconds; fix them or rebuild the database with create_db.py")
+        # Create and backfill the counter tables on older databases, with the same
+        # script create_db.py builds them from (one transaction; idempotent)
+        if conn.execute(_COUNTER_OBJECTS_SQL).fetchone()[0] < len(COUNTER_OBJECTS):
+            conn.executescript('BEGIN IMMEDIATE;' + COUNTERS_SQL + 'COMMIT;')
+    except sqlite3.Error:
+        conn.close()
+        raise
+    
+    if not _CONNECTIONS:
+        atexit.register(_close_connections)
+    _CONNECTIONS[db_path] = conn
+    return conn
+
+def _close_connections():
+    """Close every shared connection (registered with atexit)"""
+    while _CONNECTIONS:
+        _, conn = _CONNECTIONS.popitem()
+        # Let SQLite refresh any planner statistics it judges stale
+        try:
+            conn.execute('PRAGMA optimize')
+        except sqlite3.Error:
+            pass
+        conn.close()
 
 class FlightManagementCLI:
     """
@@ -25,15 +403,47 @@ class FlightManagementCLI:
     CRUD operations for flights, pilots, and destinations.
     """
     
-    def __init__(self, db_path='flight_management.db'):
+    def __init__(self, db_path='flight_management.db', exclusive=False):
         """
         Initialize CLI application with database connection parameters
         
         Args:
             db_path (str): Path to SQLite database file
+            exclusive (bool): Lock the database for this process until it exits
         """
         self.db_path = db_path
+        self.exclusive = exclusive
         self.conn = None
+        self.cursor = None  # single long-lived cursor (the CLI is single-threaded)
+        self._inserts_since_analyze = 0
+        # Reference-table caches, filled lazily by _get_destinations/_get_pilots
+        self._dest_cache = None
+        self._pilot_cache = None
+        # Dispatch table built once: menu choice -> handler
+        self._menu = {
+            0: self._exit,                      # Exit application
+            1: self.add_new_flight,             # CREATE operation
+            2: self.view_flights_by_criteria,   # READ operations
+            3: self.update_flight_information,  # UPDATE operations
+            4: self.assign_pilot_to_flight,     # Relationship management
+            5: self.view_pilot_schedule,        # Data analysis
+            6: self.view_update_destinations,   # Destination management
+            7: self.view_statistics,            # Analytics and reporting
+            8: self.add_flights_from_file,      # Batch CREATE operation
+        }
+        # Derived from the dispatch table so a new menu option cannot leave it stale
+        self._invalid_choice_msg = f"❌ Invalid option! Please choose 0-{max(self._menu)}."
+        # Scripted runs (stdin piped from a file) read lines directly and skip pauses
+        self._interactive = sys.stdin.isatty()
+        # Menu choices typed or pasted ahead on one line ("7 2 5"), not yet run;
+        # a line is only split when every token is one of these menu keys
+        self._pending_choices = deque()
+        self._menu_keys = frozenset(str(option) for option in self._menu)
+        # Completing menu prompt when prompt_toolkit is available (interactive only)
+        self._menu_session = None
+        if self._interactive and PromptSession is not None:
+            self._menu_session = PromptSession(
+                completer=WordCompleter(sorted(self._menu_keys)))
         
     def connect_database(self):
         """
@@ -41,12 +451,16 @@ class FlightManagementCLI:
         
         Returns:
             bool: True if connection successful, False otherwise
+            
+        The database runs in WAL mode, so SQLite keeps 'flight_management.db-wal'
+        and '-shm' sidecar files next to the database while it is open.
+        Calling this again (or from another instance) reuses the process-wide
+        connection instead of reopening the database
         """
         try:
-            # Create connection to SQLite database file
-            self.conn = sqlite3.connect(self.db_path)
-            # Enable foreign key constraints for data integrity
-            self.conn.execute('PRAGMA foreign_keys = ON')
+            self.conn = _open_connection(self.db_path, self.exclusive)
+            # Every handler reuses this cursor; no two result sets are iterated at once
+            self.cursor = self.conn.cursor()
             return True
         except sqlite3.Error as e:
             print(f"❌ Database connection error: {e}")
@@ -54,11 +468,15 @@ class FlightManagementCLI:
     
     def close_database(self):
         """
-        Close database connection safely
-        Ensures proper cleanup of database resources
+        Release this session's database handle
+        
+        The shared connection itself stays open for later sessions and is
+        closed by the atexit hook registered in _open_connection
         """
-        if self.conn:
-            self.conn.close()
+        if self.cursor is not None:
+            self.cursor.close()
+        self.cursor = None
+        self.conn = None
     
     def display_header(self):
         """
@@ -73,17 +491,61 @@ class FlightManagementCLI:
         """
         Display main menu options for user selection
         Each option corresponds to a major system function as required by coursework
+        
+        On a UTF-8 console the pre-encoded menu goes to the byte buffer directly,
+        skipping the per-redraw encode; other streams get the text via print()
         """
-        print("\n📋 MAIN MENU:")
-        print("1. 🆕 Add a New Flight")               # CRUD: Create operation
-        print("2. 🔍 View Flights by Criteria")      # CRUD: Read operations with filtering
-        print("3. ✏️  Update Flight Information")     # CRUD: Update operations
-        print("4. 👨‍✈️ Assign Pilot to Flight")        # Relationship management
-        print("5. 📅 View Pilot Schedule")           # Data retrieval and analysis
-        print("6. 🌍 View/Update Destination Information")  # Destination management
-        print("7. 📊 View System Statistics")        # Analytics and reporting
-        print("0. 🚪 Exit")                         # Application termination
-        print("-" * 60)
+        stdout = sys.stdout
+        buffer = getattr(stdout, 'buffer', None)
+        if buffer is not None and (stdout.encoding or '').lower().replace('-', '') == 'utf8':
+            # Flush pending text first so the menu cannot overtake earlier output
+            stdout.flush()
+            buffer.write(_MENU_BYTES)
+            buffer.flush()
+        else:
+            print(_MENU_TEXT)
+    
+    def _readline(self, prompt):
+        """
+        Read one line of user input
+        
+        Args:
+            prompt (str): Prompt text written before reading
+            
+        Returns:
+            str: The line without its trailing newline
+            
+        Raises:
+            EOFError: If standard input is exhausted
+            
+        Interactive sessions go through input(); piped input is read straight
+        from sys.stdin, bypassing readline setup on every call
+        """
+        if self._interactive:
+            return input(prompt)
+        sys.stdout.write(prompt)
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip('\n')
+    
+    def _pause(self, prompt):
+        """
+        Wait for the user to press Enter
+        
+        Args:
+            prompt (str): Prompt text written before waiting
+            
+        Raises:
+            EOFError: If standard input is exhausted
+            
+        The typed line is discarded, so it is read straight from sys.stdin
+        rather than through input()
+        """
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        if not sys.stdin.readline():
+            raise EOFError
     
     def get_user_input(self, prompt, input_type=str, required=True, options=None):
         """
@@ -93,7 +555,7 @@ class FlightManagementCLI:
             prompt (str): Input prompt message to display to user
             input_type (type): Expected input type (str, int, float)
             required (bool): Whether input is mandatory
-            options (list): Valid options for input validation
+            options (collection): Valid options for input validation (e.g. _STATUS_OPTIONS)
             
         Returns:
             Validated user input of specified type
@@ -101,9 +563,13 @@ class FlightManagementCLI:
         This function handles all user input validation centrally to ensure
         consistent error handling and data quality throughout the application
         """
+        # Resolve the converter, prompt and option hint once, not on every retry
+        coerce = _COERCERS.get(input_type, str)
+        prompt_text = f"{prompt}: "
+        options_hint = ', '.join(sorted(options)) if options else ''
         while True:
             try:
-                user_input = input(f"{prompt}: ").strip()
+                user_input = self._readline(prompt_text).strip()
                 
                 # Handle empty input validation
                 if not user_input and required:
@@ -116,20 +582,54 @@ class FlightManagementCLI:
                 
                 # Validate against provided options (for dropdown-style inputs)
                 if options and user_input not in options:
-                    print(f"❌ Invalid option. Choose from: {', '.join(options)}")
+                    print(f"❌ Invalid option. Choose from: {options_hint}")
                     continue
                 
                 # Type conversion and validation
-                if input_type == int:
-                    return int(user_input)
-                elif input_type == float:
-                    return float(user_input)
-                else:
-                    return user_input
+                return coerce(user_input)
                     
             except ValueError:
                 print(f"❌ Invalid input. Please enter a valid {input_type.__name__}.")
     
+    def _read_menu_choice(self):
+        """
+        Read the main-menu selection
+        
+        Returns:
+            int: The selected option number
+            
+        Every menu option is a single digit, so that case is converted directly
+        from the character code; anything else falls back to the same checks
+        and messages as get_user_input(..., int). At a terminal, a line holding
+        several whitespace-separated menu keys queues the rest for the
+        following prompts (a line mixing keys with other text is rejected
+        whole); piped or scripted input is always one choice per line, see
+        _split_menu_line
+        """
+        while True:
+            if self._pending_choices:
+                raw = self._pending_choices.popleft()
+            else:
+                if self._menu_session is not None:
+                    line = self._menu_session.prompt("Select an option: ")
+                else:
+                    line = self._readline("Select an option: ")
+                choices = _split_menu_line(line, self._menu_keys, self._interactive)
+                if choices is None:
+                    print(self._invalid_choice_msg)
+                    continue
+                self._pending_choices.extend(choices[1:])
+                raw = choices[0] if choices else ''
+            if len(raw) == 1 and '0' <= raw <= '9':
+                return ord(raw) - 48
+            if not raw:
+                print("❌ This field is required. Please enter a value.")
+                continue
+            try:
+                return int(raw)
+            except ValueError:
+                print("❌ Invalid input. Please enter a valid int.")
+    
     def validate_datetime(self, date_string):
         """
         Validate and parse datetime string into ISO format
@@ -138,7 +638,7 @@ class FlightManagementCLI:
             date_string (str): User input datetime string
             
         Returns:
-            str: ISO formatted datetime string
+            tuple: (ISO formatted datetime string, parsed datetime object)
             
         Raises:
             ValueError: If datetime format is invalid
@@ -148,23 +648,50 @@ class FlightManagementCLI:
         - YYYY-MM-DD HH:MM:SS (with seconds)
         - YYYY-MM-DD (date only, assumes midnight)
         """
-        # Define supported datetime formats in order of preference
-        formats = [
-            '%Y-%m-%d %H:%M',      # 2024-12-25 14:30
-            '%Y-%m-%d %H:%M:%S',   # 2024-12-25 14:30:00
-            '%Y-%m-%d'             # 2024-12-25 (assumes midnight)
-        ]
+        return _parse_dt(date_string)
+    
+    def _record_inserts(self, count):
+        """
+        Count newly inserted flights, refreshing planner statistics every _ANALYZE_EVERY
         
-        # Try each format until one works
-        for fmt in formats:
-            try:
-                dt = datetime.strptime(date_string, fmt)
-                return dt.isoformat()  # Convert to ISO format for database storage
-            except ValueError:
-                continue
+        Args:
+            count (int): Number of flights just inserted
+            
+        Raises:
+            sqlite3.Error: If ANALYZE fails (callers report it like any database error)
+        """
+        # Keep the query planner's row estimates current as flights grow
+        self._inserts_since_analyze += count
+        if self._inserts_since_analyze >= _ANALYZE_EVERY:
+            self.cursor.execute('ANALYZE flights')
+            self._inserts_since_analyze = 0
+    
+    def _get_destinations(self):
+        """
+        Get destination lookup rows, querying the database only on a cache miss
+        
+        Returns:
+            dict: destination_id -> (destination_id, airport_code, city_name, terminal_info) row,
+            in destination_id order, so listings iterate .values() and ID checks are lookups
+        """
+        if self._dest_cache is None:
+            cursor = self.cursor
+            cursor.execute(LIST_DESTINATIONS_SQL)
+            self._dest_cache = {dest['destination_id']: dest for dest in cursor}
+        return self._dest_cache
+    
+    def _get_pilots(self):
+        """
+        Get pilot lookup rows, querying the database only on a cache miss
         
-        # If no format matches, raise descriptive error
-        raise ValueError("Invalid date format. Use YYYY-MM-DD HH:MM or YYYY-MM-DD")
+        Returns:
+            dict: pilot_id -> (pilot_id, first_name, last_name) row, in pilot_id order
+        """
+        if self._pilot_cache is None:
+            cursor = self.cursor
+            cursor.execute(LIST_PILOTS_SQL)
+            self._pilot_cache = {pilot['pilot_id']: pilot for pilot in cursor}
+        return self._pilot_cache
     
     # =============================================================================
     # MENU OPTION 1: ADD NEW FLIGHT
@@ -189,84 +716,70 @@ class FlightManagementCLI:
         print("-" * 30)
         
         try:
-            cursor = self.conn.cursor()
+            cursor = self.cursor
             
-            # Get flight number with uniqueness validation
+            # Get flight number (uniqueness is enforced atomically by the INSERT below)
             flight_number = self.get_user_input("Flight Number (e.g., BA123)")
             
-            # Check for duplicate flight numbers (business rule enforcement)
-            cursor.execute("SELECT flight_number FROM flights WHERE flight_number = ?", (flight_number,))
-            if cursor.fetchone():
-                print(f"❌ Flight {flight_number} already exists!")
-                return
-            
             # Collect and validate scheduling information
             print("\n📅 Flight Scheduling:")
             departure_input = self.get_user_input("Departure Date/Time (YYYY-MM-DD HH:MM)")
-            departure_time = self.validate_datetime(departure_input)
+            _, departure_dt = self.validate_datetime(departure_input)
             
             arrival_input = self.get_user_input("Arrival Date/Time (YYYY-MM-DD HH:MM)")
-            arrival_time = self.validate_datetime(arrival_input)
+            _, arrival_dt = self.validate_datetime(arrival_input)
             
-            # Validate logical scheduling (arrival must be after departure)
-            if datetime.fromisoformat(arrival_time) <= datetime.fromisoformat(departure_time):
+            # Validate logical scheduling (arrival must be after departure); compares the
+            # datetimes validate_datetime already parsed, so nothing is re-parsed here
+            if arrival_dt <= departure_dt:
                 print("❌ Arrival time must be after departure time!")
                 return
             
             # Collect aircraft information
             aircraft_type = self.get_user_input("Aircraft Type (e.g., Boeing 737)")
             capacity = self.get_user_input("Passenger Capacity", int)
-            status = self.get_user_input("Status", options=['Scheduled', 'Delayed', 'Cancelled'])
+            status = self.get_user_input("Status", options=_STATUS_OPTIONS)
             
             # Display available destinations for user selection
             print("\n🌍 Available Destinations:")
-            cursor.execute("SELECT destination_id, airport_code, city_name FROM destinations")
-            destinations = cursor.fetchall()
+            destinations = self._get_destinations()
             
-            for dest in destinations:
-                print(f"  {dest[0]}. {dest[1]} - {dest[2]}")
+            write_lines([f"  {dest['destination_id']}. {dest['airport_code']} - {dest['city_name']}" for dest in destinations.values()])
             
             destination_id = self.get_user_input("Destination ID", int)
             
-            # Validate destination exists (foreign key constraint check)
-            cursor.execute("SELECT destination_id FROM destinations WHERE destination_id = ?", (destination_id,))
-            if not cursor.fetchone():
-                print("❌ Invalid destination ID!")
-                return
-            
             # Optional pilot assignment (demonstrates optional foreign key)
             print("\n👨‍✈️ Available Pilots (optional):")
-            cursor.execute("SELECT pilot_id, first_name, last_name FROM pilots")
-            pilots = cursor.fetchall()
+            pilots = self._get_pilots()
             
-            for pilot in pilots:
-                print(f"  {pilot[0]}. {pilot[1]} {pilot[2]}")
+            write_lines([_PILOT_ROW_FMT(**pilot) for pilot in pilots.values()])
             
             # Allow user to skip pilot assignment
-            pilot_choice = input("\nPilot ID (press Enter to skip): ").strip()
+            pilot_choice = self._readline("\nPilot ID (press Enter to skip): ").strip()
             pilot_id = int(pilot_choice) if pilot_choice else None
             
-            # Validate pilot if provided
-            if pilot_id:
-                cursor.execute("SELECT pilot_id FROM pilots WHERE pilot_id = ?", (pilot_id,))
-                if not cursor.fetchone():
-                    print("❌ Invalid pilot ID! Flight will be created without pilot assignment.")
-                    pilot_id = None
-            
-            # Insert new flight record using parameterized query (SQL injection prevention)
-            cursor.execute('''
-                INSERT INTO flights (flight_number, departure_time, arrival_time, status, 
-                                   aircraft_type, capacity, pilot_id, destination_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (flight_number, departure_time, arrival_time, status, aircraft_type, capacity, pilot_id, destination_id))
-            
-            # Commit transaction to make changes permanent
-            self.conn.commit()
+            # Insert new flight record using parameterized query (SQL injection prevention).
+            # A single autocommit statement: the foreign keys (foreign_keys=ON) validate
+            # destination and pilot atomically, raising IntegrityError if either is unknown
+            cursor.execute(INSERT_FLIGHT_SQL, (flight_number, epoch(departure_dt),
+                           epoch(arrival_dt), status, aircraft_type, capacity,
+                           pilot_id, destination_id))
+            inserted = cursor.fetchone()
+            
+            # No returned row means the flight number hit the UNIQUE constraint
+            if inserted is None:
+                print(f"❌ Flight {flight_number} already exists!")
+                return
+            
             print(f"\n✅ Flight {flight_number} added successfully!")
+            self._record_inserts(1)
             
         except ValueError as e:
             # Handle datetime validation errors
             print(f"❌ Input error: {e}")
+        except sqlite3.IntegrityError:
+            # Foreign key violation: destination or pilot does not exist
+            print("❌ Invalid destination or pilot ID.")
         except sqlite3.Error as e:
             # Handle database errors (constraints, connection issues, etc.)
             print(f"❌ Database error: {e}")
@@ -302,79 +815,54 @@ class FlightManagementCLI:
         
         choice = self.get_user_input("Select search option", int)
         
+        # Reject unknown options before touching the database
+        if choice not in (1, 2, 3):
+            print("❌ Invalid option!")
+            return
+        
         try:
-            cursor = self.conn.cursor()
+            cursor = self.cursor
             
             if choice == 1:
                 # Search by destination - demonstrates JOIN operations
-                cursor.execute("SELECT airport_code, city_name FROM destinations")
-                destinations = cursor.fetchall()
+                destinations = self._get_destinations()
                 print("\n🌍 Available Destinations:")
-                for dest in destinations:
-                    print(f"  {dest[0]} - {dest[1]}")
+                write_lines([f"  {dest['airport_code']} - {dest['city_name']}" for dest in destinations.values()])
                 
                 airport_code = self.get_user_input("Enter airport code").upper()
                 
                 # Complex JOIN query combining flights, destinations, and pilots
-                cursor.execute('''
-                    SELECT f.flight_number, f.departure_time, f.status, d.city_name,
-                           p.first_name, p.last_name
-                    FROM flights f
-                    JOIN destinations d ON f.destination_id = d.destination_id
-                    LEFT JOIN pilots p ON f.pilot_id = p.pilot_id
-                    WHERE d.airport_code = ?
-                    ORDER BY f.departure_time
-                ''', (airport_code,))
+                cursor.execute(FLIGHTS_BY_AIRPORT_SQL, (airport_code,))
                 
-                results = cursor.fetchall()
                 print(f"\n✈️ Flights to {airport_code}:")
                 
             elif choice == 2:
                 # Search by status - demonstrates filtering with enumerated values
-                status = self.get_user_input("Flight Status", options=['Scheduled', 'Delayed', 'Cancelled'])
+                status = self.get_user_input("Flight Status", options=_STATUS_OPTIONS)
                 
                 # JOIN query with status filtering
-                cursor.execute('''
-                    SELECT f.flight_number, f.departure_time, d.city_name, d.airport_code,
-                           p.first_name, p.last_name
-                    FROM flights f
-                    JOIN destinations d ON f.destination_id = d.destination_id
-                    LEFT JOIN pilots p ON f.pilot_id = p.pilot_id
-                    WHERE f.status = ?
-                    ORDER BY f.departure_time
-                ''', (status,))
+                cursor.execute(FLIGHTS_BY_STATUS_SQL, (status,))
                 
-                results = cursor.fetchall()
                 print(f"\n✈️ {status} Flights:")
                 
-            elif choice == 3:
+            else:
                 # All flights - comprehensive view demonstrating LEFT JOIN for optional relationships
-                cursor.execute('''
-                    SELECT f.flight_number, f.departure_time, f.status, d.city_name, d.airport_code,
-                           p.first_name, p.last_name
-                    FROM flights f
-                    JOIN destinations d ON f.destination_id = d.destination_id
-                    LEFT JOIN pilots p ON f.pilot_id = p.pilot_id
-                    ORDER BY f.departure_time
-                ''')
+                cursor.execute(ALL_FLIGHTS_SQL)
                 
-                results = cursor.fetchall()
                 print(f"\n✈️ All Flights:")
             
-            else:
-                print("❌ Invalid option!")
-                return
+            # Format rows straight off the cursor (no fetchall() row list) and emit
+            # them in one write; the total is reported afterwards
+            # (unassigned pilots already come back as 'Unassigned' via COALESCE)
+            lines = [_FLIGHT_ROW_FMT(i, **flight) for i, flight in enumerate(cursor, 1)]
+            write_lines(lines)
+            count = len(lines)
             
-            # Display results with proper NULL handling
-            if not results:
+            if not count:
                 print("   No flights found.")
                 return
             
-            print(f"\n📊 Found {len(results)} flight(s):")
-            for i, flight in enumerate(results, 1):
-                # Handle NULL pilot assignments gracefully
-                pilot_name = f"{flight[4]} {flight[5]}" if flight[4] else "Unassigned"
-                print(f"{i:2d}. {flight[0]} | {flight[1]} | {flight[2]} | To: {flight[3]} | Pilot: {pilot_name}")
+            print(f"\n📊 Found {count} flight(s).")
             
         except sqlite3.Error as e:
             print(f"❌ Database error: {e}")
@@ -403,34 +891,21 @@ class FlightManagementCLI:
         print("-" * 35)
         
         try:
-            cursor = self.conn.cursor()
+            cursor = self.cursor
             
             # Display existing flights for user selection
-            cursor.execute('''
-                SELECT f.flight_id, f.flight_number, f.departure_time, f.status
-                FROM flights f
-                ORDER BY f.departure_time
-            ''')
-            
-            flights = cursor.fetchall()
-            if not flights:
-                print("No flights found.")
-                return
+            cursor.execute(LIST_FLIGHTS_SQL)
             
             print("📋 Existing Flights:")
-            for flight in flights:
-                print(f"  {flight[0]}. {flight[1]} | {flight[2]} | {flight[3]}")
-            
-            flight_id = self.get_user_input("\nFlight ID to update", int)
-            
-            # Verify flight exists before attempting update
-            cursor.execute("SELECT * FROM flights WHERE flight_id = ?", (flight_id,))
-            current_flight = cursor.fetchone()
+            lines = [_FLIGHT_CHOICE_FMT(**flight) for flight in cursor]
+            write_lines(lines)
             
-            if not current_flight:
-                print("❌ Flight not found!")
+            if not lines:
+                print("No flights found.")
                 return
             
+            flight_id = self.get_user_input("\nFlight ID to update", int)
+            
             # Present update options
             print("\n🔧 What would you like to update?")
             print("1. Status")           # Most common operational update
@@ -442,26 +917,30 @@ class FlightManagementCLI:
             # Execute specific update based on user choice
             if update_choice == 1:
                 # Update flight status - demonstrates enumerated value updates
-                new_status = self.get_user_input("New Status", options=['Scheduled', 'Delayed', 'Cancelled'])
-                cursor.execute("UPDATE flights SET status = ? WHERE flight_id = ?", (new_status, flight_id))
+                new_status = self.get_user_input("New Status", options=_STATUS_OPTIONS)
+                sql, params = UPDATE_STATUS_SQL, (new_status, flight_id)
                 
             elif update_choice == 2:
                 # Update departure time - demonstrates datetime validation in updates
                 new_departure = self.get_user_input("New Departure Time (YYYY-MM-DD HH:MM)")
-                departure_time = self.validate_datetime(new_departure)
-                cursor.execute("UPDATE flights SET departure_time = ? WHERE flight_id = ?", (departure_time, flight_id))
+                _, departure_dt = self.validate_datetime(new_departure)
+                sql, params = UPDATE_DEPARTURE_SQL, (epoch(departure_dt), flight_id)
                 
             elif update_choice == 3:
                 # Update aircraft type - demonstrates text field updates
                 new_aircraft = self.get_user_input("New Aircraft Type")
-                cursor.execute("UPDATE flights SET aircraft_type = ? WHERE flight_id = ?", (new_aircraft, flight_id))
+                sql, params = UPDATE_AIRCRAFT_SQL, (new_aircraft, flight_id)
             
             else:
                 print("❌ Invalid option!")
                 return
             
-            # Commit transaction to make changes permanent
-            self.conn.commit()
+            # Execute the chosen update (autocommit: a single statement is its own transaction);
+            # no row matched means the flight ID does not exist
+            cursor.execute(sql, params)
+            if cursor.rowcount == 0:
+                print("❌ Flight not found!")
+                return
             print("✅ Flight updated successfully!")
             
         except ValueError as e:
@@ -492,50 +971,35 @@ class FlightManagementCLI:
         print("-" * 30)
         
         try:
-            cursor = self.conn.cursor()
+            cursor = self.cursor
             
             # Display flights with current pilot assignments using LEFT JOIN
-            cursor.execute('''
-                SELECT f.flight_id, f.flight_number, f.departure_time, p.first_name, p.last_name
-                FROM flights f
-                LEFT JOIN pilots p ON f.pilot_id = p.pilot_id
-                ORDER BY f.departure_time
-            ''')
-            
-            flights = cursor.fetchall()
+            cursor.execute(LIST_FLIGHT_PILOTS_SQL)
+            
             print("📋 Flights:")
-            for flight in flights:
-                # Handle NULL pilot assignments
-                pilot_name = f"{flight[3]} {flight[4]}" if flight[3] else "Unassigned"
-                print(f"  {flight[0]}. {flight[1]} | {flight[2]} | Pilot: {pilot_name}")
+            # NULL pilot assignments are rendered as 'Unassigned' by the query
+            write_lines([_FLIGHT_PILOT_FMT(**flight) for flight in cursor])
             
             flight_id = self.get_user_input("\nFlight ID", int)
             
-            # Validate flight exists
-            cursor.execute("SELECT flight_number FROM flights WHERE flight_id = ?", (flight_id,))
-            if not cursor.fetchone():
-                print("❌ Flight not found!")
-                return
-            
             # Display available pilots
-            cursor.execute("SELECT pilot_id, first_name, last_name FROM pilots")
-            pilots = cursor.fetchall()
+            pilots = self._get_pilots()
             print("\n👨‍✈️ Available Pilots:")
-            for pilot in pilots:
-                print(f"  {pilot[0]}. {pilot[1]} {pilot[2]}")
+            write_lines([_PILOT_ROW_FMT(**pilot) for pilot in pilots.values()])
             
             pilot_id = self.get_user_input("\nPilot ID", int)
             
-            # Validate pilot exists (foreign key constraint)
-            cursor.execute("SELECT first_name, last_name FROM pilots WHERE pilot_id = ?", (pilot_id,))
-            pilot_result = cursor.fetchone()
-            if not pilot_result:
+            # Update flight with pilot assignment (foreign key update). The foreign key
+            # rejects an unknown pilot; no row matched means an unknown flight. A single
+            # statement in autocommit mode is its own transaction (no BEGIN/COMMIT pair)
+            try:
+                cursor.execute(ASSIGN_PILOT_SQL, (pilot_id, flight_id))
+            except sqlite3.IntegrityError:
                 print("❌ Pilot not found!")
                 return
-            
-            # Update flight with pilot assignment (foreign key update)
-            cursor.execute("UPDATE flights SET pilot_id = ? WHERE flight_id = ?", (pilot_id, flight_id))
-            self.conn.commit()
+            if cursor.rowcount == 0:
+                print("❌ Flight not found!")
+                return
             
             print("✅ Pilot assigned successfully!")
             
@@ -562,40 +1026,31 @@ class FlightManagementCLI:
         print("-" * 25)
         
         try:
-            cursor = self.conn.cursor()
+            cursor = self.cursor
             
             # Display available pilots
-            cursor.execute("SELECT pilot_id, first_name, last_name FROM pilots")
-            pilots = cursor.fetchall()
+            pilots = self._get_pilots()
             print("👨‍✈️ Available Pilots:")
-            for pilot in pilots:
-                print(f"  {pilot[0]}. {pilot[1]} {pilot[2]}")
+            write_lines([_PILOT_ROW_FMT(**pilot) for pilot in pilots.values()])
             
             pilot_id = self.get_user_input("\nPilot ID", int)
             
-            # Validate pilot exists
-            cursor.execute("SELECT first_name, last_name FROM pilots WHERE pilot_id = ?", (pilot_id,))
-            pilot_info = cursor.fetchone()
+            # Validate pilot exists (lookup in the cached pilot list, no query)
+            pilot_info = pilots.get(pilot_id)
             if not pilot_info:
                 print("❌ Pilot not found!")
                 return
             
             # Retrieve pilot's flight schedule using JOIN operations
-            cursor.execute('''
-                SELECT f.flight_number, f.departure_time, f.arrival_time, f.status, d.city_name
-                FROM flights f
-                JOIN destinations d ON f.destination_id = d.destination_id
-                WHERE f.pilot_id = ?
-                ORDER BY f.departure_time
-            ''', (pilot_id,))
-            
-            flights = cursor.fetchall()
-            if not flights:
+            cursor.execute(PILOT_SCHEDULE_SQL, (pilot_id,))
+            
+            # Format rows straight off the cursor instead of materialising them first
+            lines = [_SCHEDULE_ROW_FMT(i, **flight) for i, flight in enumerate(cursor, 1)]
+            if not lines:
                 print("No flights assigned to this pilot.")
             else:
-                print(f"\n📅 Schedule for {pilot_info[0]} {pilot_info[1]}:")
-                for i, flight in enumerate(flights, 1):
-                    print(f"{i}. {flight[0]} | {flight[1]} → {flight[2]} | {flight[3]} | To: {flight[4]}")
+                print(f"\n📅 Schedule for {pilot_info['first_name']} {pilot_info['last_name']}:")
+                write_lines(lines)
             
         except sqlite3.Error as e:
             print(f"❌ Database error: {e}")
@@ -621,7 +1076,7 @@ class FlightManagementCLI:
         print("-" * 30)
         
         try:
-            cursor = self.conn.cursor()
+            cursor = self.cursor
             
             print("Options:")
             print("1. View all destinations")        # READ operation with aggregation
@@ -631,42 +1086,33 @@ class FlightManagementCLI:
             
             if option == 1:
                 # Complex query demonstrating LEFT JOIN and GROUP BY
-                cursor.execute('''
-                    SELECT d.destination_id, d.airport_code, d.city_name, d.country, 
-                           d.terminal_info, COUNT(f.flight_id) as flight_count
-                    FROM destinations d
-                    LEFT JOIN flights f ON d.destination_id = f.destination_id
-                    GROUP BY d.destination_id
-                    ORDER BY d.city_name
-                ''')
+                cursor.execute(DESTINATION_SUMMARY_SQL)
                 
-                destinations = cursor.fetchall()
                 print(f"\n🌍 All Destinations:")
-                for dest in destinations:
-                    print(f"{dest[0]}. {dest[1]} - {dest[2]}, {dest[3]} | Terminal: {dest[4]} | Flights: {dest[5]}")
+                write_lines([f"{dest['destination_id']}. {dest['airport_code']} - {dest['city_name']}, {dest['country']} | "
+                             f"Terminal: {dest['terminal_info']} | Flights: {dest['flight_count']}"
+                             for dest in cursor])
                 
             elif option == 2:
                 # Display destinations for selection
-                cursor.execute("SELECT destination_id, airport_code, city_name, terminal_info FROM destinations")
-                destinations = cursor.fetchall()
+                destinations = self._get_destinations()
                 print("\n🌍 Destinations:")
-                for dest in destinations:
-                    print(f"  {dest[0]}. {dest[1]} - {dest[2]} | Current Terminal: {dest[3]}")
+                write_lines([f"  {dest['destination_id']}. {dest['airport_code']} - {dest['city_name']} | "
+                             f"Current Terminal: {dest['terminal_info']}"
+                             for dest in destinations.values()])
                 
                 dest_id = self.get_user_input("\nDestination ID to update", int)
                 
-                # Validate destination exists
-                cursor.execute("SELECT destination_id FROM destinations WHERE destination_id = ?", (dest_id,))
-                if not cursor.fetchone():
+                # Validate destination exists (lookup in the cached list, no query)
+                if dest_id not in destinations:
                     print("❌ Destination not found!")
                     return
                 
                 new_terminal = self.get_user_input("New Terminal Information")
                 
-                # Execute UPDATE operation
-                cursor.execute("UPDATE destinations SET terminal_info = ? WHERE destination_id = ?", 
-                             (new_terminal, dest_id))
-                self.conn.commit()
+                # Execute UPDATE operation (autocommits as a single statement)
+                cursor.execute(UPDATE_TERMINAL_SQL, (new_terminal, dest_id))
+                self._dest_cache = None  # terminal_info changed; refetch on next listing
                 print("✅ Destination updated successfully!")
             
         except sqlite3.Error as e:
@@ -693,47 +1139,179 @@ class FlightManagementCLI:
         print("-" * 25)
         
         try:
-            cursor = self.conn.cursor()
-            
-            # Basic record counts using COUNT aggregate function
-            cursor.execute("SELECT COUNT(*) FROM pilots")
-            pilot_count = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM destinations")
-            dest_count = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM flights")
-            flight_count = cursor.fetchone()[0]
-            
-            print(f"📊 Database Summary:")
-            print(f"   👨‍✈️ Total Pilots: {pilot_count}")
-            print(f"   🌍 Total Destinations: {dest_count}")
-            print(f"   ✈️ Total Flights: {flight_count}")
-            
-            # Flight status breakdown using GROUP BY
-            cursor.execute("SELECT status, COUNT(*) FROM flights GROUP BY status")
-            statuses = cursor.fetchall()
-            print(f"\n✈️ Flight Status Breakdown:")
-            for status in statuses:
-                print(f"   {status[0]}: {status[1]} flights")
-            
-            # Top destinations analysis using complex JOIN and aggregation
-            cursor.execute('''
-                SELECT d.city_name, d.airport_code, COUNT(f.flight_id) as flight_count
-                FROM destinations d
-                LEFT JOIN flights f ON d.destination_id = f.destination_id
-                GROUP BY d.destination_id
-                ORDER BY flight_count DESC
-                LIMIT 5
-            ''')
-            top_destinations = cursor.fetchall()
-            print(f"\n🌍 Top Destinations:")
-            for dest in top_destinations:
-                print(f"   {dest[0]} ({dest[1]}): {dest[2]} flights")
+            stats = self._fetch_statistics()
+            sys.stdout.write(_STATS_TMPL % (stats['pilots'], stats['destinations'], stats['flights']))
+            
+            # Flight status breakdown (every status present, in status order); the
+            # heading goes out in the same write as its rows
+            write_lines(["\n✈️ Flight Status Breakdown:"]
+                        + [f"   {status}: {count} flights"
+                           for status, count in stats['status'].items()])
+            
+            write_lines(["\n🌍 Top Destinations:"]
+                        + [f"   {dest['city']} ({dest['code']}): {dest['flights']} flights"
+                           for dest in stats['top_destinations']])
             
         except sqlite3.Error as e:
             print(f"❌ Database error: {e}")
     
+    def _fetch_statistics(self):
+        """
+        Run the statistics query
+        
+        Returns:
+            dict: The decoded statistics document, with top_destinations
+            ordered by flight count (highest first)
+            
+        Raises:
+            sqlite3.Error: If the query fails
+        """
+        cursor = self.cursor
+        
+        # query_only guards the read-only panel: any write attempted while it is
+        # set fails instead of touching the database; cleared again on every path
+        cursor.execute('PRAGMA query_only = 1')
+        try:
+            # One statement, one row: the figures come from a single snapshot
+            # without an explicit transaction. execute() returns the cursor
+            # itself, so chaining reuses the session cursor
+            text = cursor.execute(STATISTICS_SQL).fetchone()[0]
+        finally:
+            cursor.execute('PRAGMA query_only = 0')
+        
+        stats = json.loads(text)
+        # json_group_array keeps whatever order its input arrived in; the sort
+        # is stable, so tied destinations keep the order the query gave them
+        stats['top_destinations'].sort(key=lambda dest: dest['flights'], reverse=True)
+        return stats
+    
+    def print_statistics_json(self):
+        """
+        One-shot --json mode: write the system statistics as one JSON document
+        
+        Returns:
+            int: Process exit status (0 on success, 1 on failure)
+            
+        stdout carries only the document, so scripts can hand it straight to
+        json.loads or jq; every other message goes to stderr
+        """
+        # connect_database reports failures with print(); keep them off stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            connected = self.connect_database()
+        if not connected:
+            return 1
+        
+        try:
+            # Compact and non-ASCII kept as is, like the JSON SQLite builds
+            sys.stdout.write(json.dumps(self._fetch_statistics(), ensure_ascii=False,
+                                        separators=(',', ':')) + "\n")
+            return 0
+        except sqlite3.Error as e:
+            print(f"❌ Database error: {e}", file=sys.stderr)
+            return 1
+        finally:
+            self.close_database()
+    
+    def _exit(self):
+        """
+        Menu option 0: say goodbye before the main loop ends
+        
+        Returns:
+            bool: Always True, signalling run() to stop
+        """
+        print("\n👋 Thank you for using Flight Management System!")
+        print("✈️ Safe travels!")
+        return True
+    
+    # =============================================================================
+    # MENU OPTION 8: BULK ADD FLIGHTS FROM CSV
+    # Implements batch CREATE operation for flights table
+    # =============================================================================
+    
+    def add_flights_from_file(self, path=None):
+        """
+        Add many flights from a CSV file in a single transaction
+        
+        Each row holds: flight_number, departure, arrival, aircraft_type, capacity,
+        status, destination_id[, pilot_id]. An optional header row starting with
+        "flight_number" is skipped. Rows are validated in Python with the same
+        rules as add_new_flight; invalid rows are reported and left out, and the
+        rest go to the database with one executemany inside one transaction, so
+        the whole file costs a single commit instead of one per flight
+        
+        Args:
+            path (str): CSV file to load (prompted for when omitted)
+        """
+        print("\n📥 BULK ADD FLIGHTS FROM CSV")
+        print("-" * 30)
+        
+        if path is None:
+            path = self.get_user_input("CSV file path")
+        
+        destinations = self._get_destinations()
+        pilots = self._get_pilots()
+        rows = []
+        skipped = 0
+        
+        try:
+            with open(path, newline='', encoding='utf-8') as csv_file:
+                for line_no, record in enumerate(csv.reader(csv_file), 1):
+                    if not record or (line_no == 1 and record[0].strip().lower() == 'flight_number'):
+                        continue
+                    try:
+                        if len(record) not in (7, 8):
+                            raise ValueError("expected 7 or 8 columns")
+                        (flight_number, departure, arrival, aircraft_type,
+                         capacity, status, destination_id) = (field.strip() for field in record[:7])
+                        pilot_field = record[7].strip() if len(record) == 8 else ''
+                        
+                        if not flight_number or not aircraft_type:
+                            raise ValueError("flight number and aircraft type are required")
+                        _, departure_dt = _parse_dt(departure)
+                        _, arrival_dt = _parse_dt(arrival)
+                        if arrival_dt <= departure_dt:
+                            raise ValueError("arrival time must be after departure time")
+                        if status not in _STATUS_OPTIONS:
+                            raise ValueError(f"unknown status '{status}'")
+                        capacity = int(capacity)
+                        destination_id = int(destination_id)
+                        if destination_id not in destinations:
+                            raise ValueError(f"unknown destination ID {destination_id}")
+                        pilot_id = int(pilot_field) if pilot_field else None
+                        if pilot_id is not None and pilot_id not in pilots:
+                            raise ValueError(f"unknown pilot ID {pilot_id}")
+                    except ValueError as e:
+                        print(f"⚠️ Line {line_no} skipped: {e}")
+                        skipped += 1
+                        continue
+                    
+                    rows.append((flight_number, epoch(departure_dt), epoch(arrival_dt),
+                                 status, aircraft_type, capacity, pilot_id, destination_id))
+        except (OSError, csv.Error) as e:
+            print(f"❌ Could not read file: {e}")
+            return
+        
+        if not rows:
+            print("❌ No valid flights found in file.")
+            return
+        
+        try:
+            # The connection is in autocommit mode, so open the transaction
+            # explicitly; the with-block commits it, or rolls back on error
+            self.cursor.execute('BEGIN IMMEDIATE')
+            with self.conn:
+                self.cursor.executemany(BULK_INSERT_FLIGHT_SQL, rows)
+            added = self.cursor.rowcount
+            
+            print(f"\n✅ {added} flight(s) added successfully!")
+            if added < len(rows):
+                print(f"⚠️ {len(rows) - added} flight(s) already existed and were skipped.")
+            if skipped:
+                print(f"⚠️ {skipped} invalid line(s) skipped.")
+            self._record_inserts(added)
+        except sqlite3.Error as e:
+            print(f"❌ Database error: {e}")
+    
     # =============================================================================
     # MAIN APPLICATION RUNNER
     # Controls overall application flow and user interaction
@@ -764,58 +1342,42 @@ class FlightManagementCLI:
             
             # Main application loop - continues until user exits
             while True:
-                # Display menu and get user choice
-                self.display_menu()
+                # Display menu and get user choice (scripted runs and queued
+                # choices skip the redraw)
+                if self._interactive and not self._pending_choices:
+                    self.display_menu()
                 
                 try:
-                    choice = self.get_user_input("Select an option", int)
+                    choice = self._read_menu_choice()
                     
-                    # Handle user selection with appropriate function calls
-                    if choice == 0:
-                        # Exit application gracefully
-                        print("\n👋 Thank you for using Flight Management System!")
-                        print("✈️ Safe travels!")
-                        break
-                    elif choice == 1:
-                        # Menu Option 1: Add new flight (CREATE operation)
-                        self.add_new_flight()
-                    elif choice == 2:
-                        # Menu Option 2: View flights by criteria (READ operations)
-                        self.view_flights_by_criteria()
-                    elif choice == 3:
-                        # Menu Option 3: Update flight information (UPDATE operations)
-                        self.update_flight_information()
-                    elif choice == 4:
-                        # Menu Option 4: Assign pilot to flight (relationship management)
-                        self.assign_pilot_to_flight()
-                    elif choice == 5:
-                        # Menu Option 5: View pilot schedule (data analysis)
-                        self.view_pilot_schedule()
-                    elif choice == 6:
-                        # Menu Option 6: Destination management
-                        self.view_update_destinations()
-                    elif choice == 7:
-                        # Menu Option 7: System statistics and analytics
-                        self.view_statistics()
-                    else:
+                    # Handle user selection via the menu dispatch table
+                    handler = self._menu.get(choice)
+                    if handler is None:
                         # Handle invalid menu selections
-                        print("❌ Invalid option! Please choose 0-7.")
+                        print(self._invalid_choice_msg)
+                    elif handler():
+                        # Only _exit returns True: leave the main loop
+                        break
                     
-                    # Pause for user to review results before continuing
-                    input("\n🔄 Press Enter to continue...")
+                    # Pause for user to review results before continuing (interactive
+                    # only, and not between choices queued on one line)
+                    if self._interactive and not self._pending_choices:
+                        self._pause("\n🔄 Press Enter to continue...")
                     
-                except KeyboardInterrupt:
-                    # Handle Ctrl+C gracefully
+                except (KeyboardInterrupt, EOFError):
+                    # Handle Ctrl+C or end of input gracefully
                     print("\n\n👋 Goodbye!")
                     break
                 except Exception as e:
                     # Handle unexpected errors gracefully
                     print(f"❌ An error occurred: {e}")
-                    input("Press Enter to continue...")
+                    if self._interactive:
+                        self._pause("Press Enter to continue...")
         
         finally:
-            # Ensure database connection is properly closed regardless of how loop exits
-            # This is critical for preventing database locks and resource leaks
+            # Release this session's cursor however the loop exits; the shared
+            # connection (and, with --exclusive, its lock) stays open until the
+            # atexit hook closes it when the process ends
             self.close_database()
 
 def main():
@@ -828,15 +1390,29 @@ def main():
     - Application initialization and launch
     - Error handling for startup issues
     
-    Called when script is run directly (if __name__ == "__main__")
+    Called when script is run directly (if __name__ == "__main__").
+    Pass --json to print the system statistics as one JSON object and exit,
+    and --exclusive to lock the database for this process; the lock is held
+    until the process exits, not just while the menu runs
+    
+    Returns:
+        int: Process exit status (non-zero when --json fails)
     """
-    import os
+    args = sys.argv[1:]
+    exclusive = '--exclusive' in args
+    
+    # Scripted statistics: no banner, menu or prompts, only the JSON on stdout
+    if '--json' in args:
+        if not os.path.isfile('flight_management.db'):
+            print("❌ Database file 'flight_management.db' not found!", file=sys.stderr)
+            return 1
+        return FlightManagementCLI(exclusive=exclusive).print_statistics_json()
     
     print("🛩️ Flight Management System - Starting Up...")
     
     # Check if database file exists before attempting to run application
     # This prevents confusing error messages and provides helpful guidance
-    if not os.path.exists('flight_management.db'):
+    if not os.path.isfile('flight_management.db'):
         print("❌ Database file 'flight_management.db' not found!")
         print("💡 Please run the database creation script first:")
         print("   python create_clean_db.py")
@@ -847,7 +1423,7 @@ def main():
     
     # Create and run the CLI application instance
     try:
-        app = FlightManagementCLI()
+        app = FlightManagementCLI(exclusive=exclusive)
         app.run()
     except Exception as e:
         # Handle any unexpected errors during application startup
@@ -857,4 +1433,4 @@ def main():
 # Python idiom: only run main() when script is executed directly
 # This allows the module to be imported without automatically running the application
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,11 @@
+#!/bin/sh
+# Launch the CLI under PyPy when it is installed: its JIT speeds up the
+# interpreter-bound parts (input parsing, row formatting). PyPy's bundled
+# sqlite3 module is API-compatible, so no code changes are needed.
+# Falls back to CPython otherwise.
+cd "$(dirname "$0")" || exit 1
+if command -v pypy3 >/dev/null 2>&1; then
+    exec pypy3 flight_cli.py "$@"
+fi
+echo "pypy3 not found, running with python3" >&2
+exec python3 flight_cli.py "$@"